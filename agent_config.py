@@ -9,20 +9,83 @@ This module centralizes all agent-related configuration including:
   - Monitoring and alerting thresholds
 """
 
+from __future__ import annotations
+
+import functools
+import json
 import os
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import Any, Optional
-from dotenv import load_dotenv
+from dataclasses import dataclass, field, fields, replace
+from enum import IntFlag, StrEnum, auto
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable
+
+try:
+    import orjson  # Optional: faster JSON encoding
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# .env is parsed lazily on first config build, not at import time
+_env_loaded = False
+
+
+def _ensure_env_loaded() -> None:
+    """Load .env once per process (skipped if another worker already did)."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    if not os.environ.get("_DOTENV_LOADED"):
+        from dotenv import load_dotenv
+        load_dotenv()
+        os.environ["_DOTENV_LOADED"] = "1"
+    _env_loaded = True
+
+
+# Environment variables consulted by AgentConfiguration.validate()
+_VALIDATE_ENV_KEYS = (
+    "FMP_API_KEY",
+    "POLYGON_API_KEY",
+    "TELEGRAM_BOT_TOKEN",
+    "TELEGRAM_CHAT_ID",
+    "GITHUB_TOKEN",
+)
+
 
-load_dotenv()
+@functools.lru_cache(maxsize=1)
+def _env_snapshot() -> dict[str, str]:
+    """
+    Snapshot the API-key env vars once per process.
+    Call _env_snapshot.cache_clear() after changing os.environ (e.g. in tests).
+    """
+    _ensure_env_loaded()
+    return {key: os.environ.get(key, "") for key in _VALIDATE_ENV_KEYS}
+
+
+# validate() results keyed on (config sections, env fingerprint). Frozen
+# config sections are hashable, so equal configs share an entry.
+_validate_cache: dict[tuple, tuple[str, ...]] = {}
+_VALIDATE_CACHE_MAX = 64
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # AGENT MODES
 # ═══════════════════════════════════════════════════════════════════════════════
 
-class AgentOperatingMode(Enum):
+class _CaseInsensitiveStrEnum(StrEnum):
+    """StrEnum whose constructor also accepts differently-cased values."""
+    
+    @classmethod
+    def _missing_(cls, value: object) -> _CaseInsensitiveStrEnum | None:
+        # Exact values hit Enum's _value2member_map_ directly; only
+        # mismatched input ("Supervised", " SILENT ") pays for normalization.
+        if isinstance(value, str):
+            return cls._value2member_map_.get(value.strip().lower())
+        return None
+
+
+class AgentOperatingMode(_CaseInsensitiveStrEnum):
     """Operating modes for the AI agent."""
     AUTONOMOUS = "autonomous"      # Agent executes decisions independently
     SUPERVISED = "supervised"      # Agent proposes, user approves
@@ -31,7 +94,7 @@ class AgentOperatingMode(Enum):
     BACKTESTING = "backtesting"    # Agent runs in simulation mode
 
 
-class AlertDeliveryMode(Enum):
+class AlertDeliveryMode(_CaseInsensitiveStrEnum):
     """How alerts are delivered."""
     IMMEDIATE = "immediate"        # Send alerts immediately
     BATCHED = "batched"           # Batch alerts and send periodically
@@ -43,7 +106,7 @@ class AlertDeliveryMode(Enum):
 # AGENT CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentSettings:
     """Core agent settings."""
     
@@ -69,34 +132,53 @@ class AgentSettings:
     verbose_logging: bool = False
 
 
-@dataclass
-class ToolPermissions:
-    """Permissions for tool categories."""
-    
-    # Market data tools - always enabled
-    market_data: bool = True
-    
-    # Technical analysis - always enabled
-    technical_analysis: bool = True
+class ToolPerm(IntFlag):
+    """Tool category permission bits."""
+    MARKET_DATA = auto()           # Market data tools - always enabled
+    TECHNICAL_ANALYSIS = auto()    # Technical analysis - always enabled
+    MACRO_ANALYSIS = auto()        # Macro analysis - requires API keys
+    NOTIFICATIONS = auto()         # Notifications - can be disabled for testing
+    STATE_WRITE = auto()           # State management - controlled write access
+    EXTERNAL_DATA = auto()         # External data - MCP integration
+    MEMORY_READ = auto()           # Memory operations
+    MEMORY_WRITE = auto()
     
-    # Macro analysis - requires API keys
-    macro_analysis: bool = True
+    ALL = (
+        MARKET_DATA | TECHNICAL_ANALYSIS | MACRO_ANALYSIS | NOTIFICATIONS
+        | STATE_WRITE | EXTERNAL_DATA | MEMORY_READ | MEMORY_WRITE
+    )
+
+
+def _perm_property(perm: ToolPerm) -> property:
+    """Read-only bool view of one ToolPerm bit (keeps the old field names working)."""
+    return property(lambda self: bool(self.flags & perm))
+
+
+@dataclass(slots=True, frozen=True)
+class ToolPermissions:
+    """Permissions for tool categories, stored as a single ToolPerm bitfield."""
     
-    # Notifications - can be disabled for testing
-    notifications: bool = True
+    flags: ToolPerm = ToolPerm.ALL
     
-    # State management - controlled write access
-    state_write: bool = True
+    market_data = _perm_property(ToolPerm.MARKET_DATA)
+    technical_analysis = _perm_property(ToolPerm.TECHNICAL_ANALYSIS)
+    macro_analysis = _perm_property(ToolPerm.MACRO_ANALYSIS)
+    notifications = _perm_property(ToolPerm.NOTIFICATIONS)
+    state_write = _perm_property(ToolPerm.STATE_WRITE)
+    external_data = _perm_property(ToolPerm.EXTERNAL_DATA)
+    memory_read = _perm_property(ToolPerm.MEMORY_READ)
+    memory_write = _perm_property(ToolPerm.MEMORY_WRITE)
     
-    # External data - MCP integration
-    external_data: bool = True
+    def allows(self, mask: ToolPerm) -> bool:
+        """True if every permission in mask is granted."""
+        return self.flags & mask == mask
     
-    # Memory operations
-    memory_read: bool = True
-    memory_write: bool = True
+    def without(self, mask: ToolPerm) -> ToolPermissions:
+        """Copy with the permissions in mask revoked."""
+        return replace(self, flags=self.flags & ~mask)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MCPServerSettings:
     """Settings for MCP server integration."""
     
@@ -123,7 +205,7 @@ class MCPServerSettings:
     thinking_timeout_sec: int = 60
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMSettings:
     """Settings for LLM integration (optional)."""
     
@@ -143,7 +225,7 @@ class LLMSettings:
     enable_caching: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MonitoringThresholds:
     """Thresholds for monitoring and alerting."""
     
@@ -175,13 +257,57 @@ class MonitoringThresholds:
     vix_elevated_threshold: float = 20.0
     vix_high_threshold: float = 30.0
     vix_extreme_threshold: float = 40.0
+    
+    def as_array(self) -> np.ndarray:
+        """
+        Read-only float64 vector of all thresholds in field order, for
+        vectorized checks, e.g. rsi_values > th.as_array()[IDX_RSI_OVERBOUGHT].
+        """
+        return _thresholds_array(self)
+
+
+# Shared default thresholds (immutable, so one instance serves every config)
+_DEFAULT_THRESHOLDS = MonitoringThresholds()
+
+
+def thresholds_with(**overrides: Any) -> MonitoringThresholds:
+    """Default thresholds with the given fields overridden (e.g. per backtest scenario)."""
+    return replace(_DEFAULT_THRESHOLDS, **overrides)
+
+
+# Field order of MonitoringThresholds.as_array() and the index constants into it
+THRESHOLD_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(MonitoringThresholds))
+IDX_SMA_PERIOD = THRESHOLD_FIELDS.index("sma_period")
+IDX_RSI_OVERBOUGHT = THRESHOLD_FIELDS.index("rsi_overbought")
+IDX_RSI_OVERSOLD = THRESHOLD_FIELDS.index("rsi_oversold")
+IDX_RSI_EXTREME_OVERBOUGHT = THRESHOLD_FIELDS.index("rsi_extreme_overbought")
+IDX_RSI_EXTREME_OVERSOLD = THRESHOLD_FIELDS.index("rsi_extreme_oversold")
+IDX_TRAILING_STOP_PERCENT = THRESHOLD_FIELDS.index("trailing_stop_percent")
+IDX_BTC_CRASH_24H = THRESHOLD_FIELDS.index("btc_crash_threshold_24h")
+IDX_BTC_WARNING_24H = THRESHOLD_FIELDS.index("btc_warning_threshold_24h")
+IDX_BTC_CRASH_7D = THRESHOLD_FIELDS.index("btc_crash_threshold_7d")
+IDX_VIX_ELEVATED = THRESHOLD_FIELDS.index("vix_elevated_threshold")
+IDX_VIX_HIGH = THRESHOLD_FIELDS.index("vix_high_threshold")
+IDX_VIX_EXTREME = THRESHOLD_FIELDS.index("vix_extreme_threshold")
+
+_get_threshold_values = attrgetter(*THRESHOLD_FIELDS)
+
+
+@functools.lru_cache(maxsize=32)
+def _thresholds_array(thresholds: MonitoringThresholds) -> np.ndarray:
+    """Build (once per distinct frozen thresholds value) the as_array() vector."""
+    import numpy as np
+    
+    values = np.array(_get_threshold_values(thresholds), dtype=np.float64)
+    values.flags.writeable = False
+    return values
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # COMPLETE AGENT CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentConfiguration:
     """Complete configuration for the Market Monitor Agent."""
     
@@ -189,37 +315,42 @@ class AgentConfiguration:
     permissions: ToolPermissions = field(default_factory=ToolPermissions)
     mcp: MCPServerSettings = field(default_factory=MCPServerSettings)
     llm: LLMSettings = field(default_factory=LLMSettings)
-    thresholds: MonitoringThresholds = field(default_factory=MonitoringThresholds)
+    thresholds: MonitoringThresholds = _DEFAULT_THRESHOLDS
     
     def validate(self) -> list[str]:
         """Validate configuration and return list of issues."""
-        issues = []
-        
-        # Check API keys
-        if self.permissions.macro_analysis:
-            if not os.getenv("FMP_API_KEY"):
-                issues.append("FMP_API_KEY not set - macro analysis will be limited")
+        _ensure_env_loaded()
+        env = _env_snapshot()
+        llm_key = os.environ.get(self.llm.api_key_env_var, "") if self.llm.api_key_env_var else ""
         
-        if self.permissions.market_data:
-            if not os.getenv("POLYGON_API_KEY"):
-                issues.append("POLYGON_API_KEY not set - will use yfinance fallback")
-        
-        if self.permissions.notifications:
-            if not os.getenv("TELEGRAM_BOT_TOKEN"):
-                issues.append("TELEGRAM_BOT_TOKEN not set - alerts disabled")
-            if not os.getenv("TELEGRAM_CHAT_ID"):
-                issues.append("TELEGRAM_CHAT_ID not set - alerts disabled")
+        cache_key = (self.permissions, self.mcp, self.llm, tuple(env.values()), llm_key)
+        cached = _validate_cache.get(cache_key)
+        if cached is None:
+            if len(_validate_cache) >= _VALIDATE_CACHE_MAX:
+                _validate_cache.clear()
+            cached = _validate_cache[cache_key] = tuple(self._collect_issues(env, llm_key))
+        return list(cached)
+    
+    def _collect_issues(self, env: dict[str, str], llm_key: str) -> list[str]:
+        """Run the validation checks against an env snapshot."""
+        # Simple "permission enabled but API key missing" checks
+        flags = self.permissions.flags
+        issues = [
+            message
+            for perm, env_key, message in _VALIDATION_RULES
+            if flags & perm and not env[env_key]
+        ]
         
         # Check MCP settings
         if self.mcp.github_enabled and self.mcp.github_auto_create_issues:
             if not self.mcp.github_repo:
                 issues.append("GitHub repo not configured for auto-issue creation")
-            if not os.getenv("GITHUB_TOKEN"):
+            if not env["GITHUB_TOKEN"]:
                 issues.append("GITHUB_TOKEN not set - GitHub MCP disabled")
         
         # Check LLM settings
         if self.llm.provider != "none":
-            if self.llm.api_key_env_var and not os.getenv(self.llm.api_key_env_var):
+            if self.llm.api_key_env_var and not llm_key:
                 issues.append(f"LLM API key ({self.llm.api_key_env_var}) not set")
         
         return issues
@@ -227,140 +358,261 @@ class AgentConfiguration:
     def to_dict(self) -> dict[str, Any]:
         """Convert configuration to dictionary."""
         return {
-            "settings": {
-                "mode": self.settings.mode.value,
-                "alert_mode": self.settings.alert_mode.value,
-                "min_confidence_for_action": self.settings.min_confidence_for_action,
-                "max_actions_per_hour": self.settings.max_actions_per_hour,
-                "enable_memory": self.settings.enable_memory,
-            },
-            "permissions": {
-                "market_data": self.permissions.market_data,
-                "technical_analysis": self.permissions.technical_analysis,
-                "macro_analysis": self.permissions.macro_analysis,
-                "notifications": self.permissions.notifications,
-                "state_write": self.permissions.state_write,
-                "external_data": self.permissions.external_data,
-            },
-            "mcp": {
-                "github_enabled": self.mcp.github_enabled,
-                "memory_enabled": self.mcp.memory_enabled,
-                "fetch_enabled": self.mcp.fetch_enabled,
-                "sequential_thinking_enabled": self.mcp.sequential_thinking_enabled,
-            },
-            "thresholds": {
-                "sma_period": self.thresholds.sma_period,
-                "rsi_overbought": self.thresholds.rsi_overbought,
-                "rsi_oversold": self.thresholds.rsi_oversold,
-                "trailing_stop_percent": self.thresholds.trailing_stop_percent,
-                "btc_crash_threshold_24h": self.thresholds.btc_crash_threshold_24h,
-            },
+            section: {key: getter(self) for key, getter in entries}
+            for section, entries in _TO_DICT_SPEC
         }
+    
+    def to_json(self) -> bytes:
+        """Serialize to_dict() output to JSON bytes (uses orjson when installed)."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict()).encode()
+
+
+# (permission bit, env var, message) rules checked by validate()
+_VALIDATION_RULES: tuple[tuple[ToolPerm, str, str], ...] = (
+    (ToolPerm.MACRO_ANALYSIS, "FMP_API_KEY",
+     "FMP_API_KEY not set - macro analysis will be limited"),
+    (ToolPerm.MARKET_DATA, "POLYGON_API_KEY",
+     "POLYGON_API_KEY not set - will use yfinance fallback"),
+    (ToolPerm.NOTIFICATIONS, "TELEGRAM_BOT_TOKEN",
+     "TELEGRAM_BOT_TOKEN not set - alerts disabled"),
+    (ToolPerm.NOTIFICATIONS, "TELEGRAM_CHAT_ID",
+     "TELEGRAM_CHAT_ID not set - alerts disabled"),
+)
+
+# Serialized subset of AgentConfiguration used by to_dict():
+# (section, ((key, getter), ...)) with C-level attrgetter leaves.
+_TO_DICT_SPEC: tuple[tuple[str, tuple[tuple[str, attrgetter], ...]], ...] = (
+    ("settings", (
+        ("mode", attrgetter("settings.mode")),
+        ("alert_mode", attrgetter("settings.alert_mode")),
+        ("min_confidence_for_action", attrgetter("settings.min_confidence_for_action")),
+        ("max_actions_per_hour", attrgetter("settings.max_actions_per_hour")),
+        ("enable_memory", attrgetter("settings.enable_memory")),
+    )),
+    ("permissions", (
+        ("market_data", attrgetter("permissions.market_data")),
+        ("technical_analysis", attrgetter("permissions.technical_analysis")),
+        ("macro_analysis", attrgetter("permissions.macro_analysis")),
+        ("notifications", attrgetter("permissions.notifications")),
+        ("state_write", attrgetter("permissions.state_write")),
+        ("external_data", attrgetter("permissions.external_data")),
+    )),
+    ("mcp", (
+        ("github_enabled", attrgetter("mcp.github_enabled")),
+        ("memory_enabled", attrgetter("mcp.memory_enabled")),
+        ("fetch_enabled", attrgetter("mcp.fetch_enabled")),
+        ("sequential_thinking_enabled", attrgetter("mcp.sequential_thinking_enabled")),
+    )),
+    ("thresholds", (
+        ("sma_period", attrgetter("thresholds.sma_period")),
+        ("rsi_overbought", attrgetter("thresholds.rsi_overbought")),
+        ("rsi_oversold", attrgetter("thresholds.rsi_oversold")),
+        ("trailing_stop_percent", attrgetter("thresholds.trailing_stop_percent")),
+        ("btc_crash_threshold_24h", attrgetter("thresholds.btc_crash_threshold_24h")),
+    )),
+)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # PRESET CONFIGURATIONS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def _override(config: AgentConfiguration, **sections: dict[str, Any]) -> AgentConfiguration:
+    """Return a copy of config with per-section field overrides applied."""
+    return replace(config, **{
+        name: replace(getattr(config, name), **fields)
+        for name, fields in sections.items()
+    })
+
+
+@functools.lru_cache(maxsize=1)
+def _build_default_config() -> AgentConfiguration:
+    """Build the default configuration template."""
+    return AgentConfiguration()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_conservative_config() -> AgentConfiguration:
+    """Build the conservative template (tighter thresholds)."""
+    return _override(
+        AgentConfiguration(thresholds=thresholds_with(
+            trailing_stop_percent=3.0,
+            btc_crash_threshold_24h=-7.0,
+            rsi_overbought=65.0,
+            rsi_oversold=35.0,
+        )),
+        settings={"mode": AgentOperatingMode.SUPERVISED},
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _build_aggressive_config() -> AgentConfiguration:
+    """Build the aggressive template (looser thresholds)."""
+    return _override(
+        AgentConfiguration(thresholds=thresholds_with(
+            trailing_stop_percent=8.0,
+            btc_crash_threshold_24h=-15.0,
+            rsi_overbought=75.0,
+            rsi_oversold=25.0,
+        )),
+        settings={"mode": AgentOperatingMode.AUTONOMOUS},
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _build_testing_config() -> AgentConfiguration:
+    """Build the testing template (no external calls)."""
+    return _override(
+        AgentConfiguration(),
+        settings={"mode": AgentOperatingMode.MONITORING, "alert_mode": AlertDeliveryMode.SILENT},
+        permissions={"flags": ToolPerm.ALL & ~ToolPerm.NOTIFICATIONS},
+        mcp={"github_enabled": False, "fetch_enabled": False},
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _build_backtest_config() -> AgentConfiguration:
+    """Build the backtesting template."""
+    return _override(
+        AgentConfiguration(),
+        settings={"mode": AgentOperatingMode.BACKTESTING, "alert_mode": AlertDeliveryMode.SILENT},
+        permissions={"flags": ToolPerm.ALL & ~(ToolPerm.NOTIFICATIONS | ToolPerm.STATE_WRITE)},
+        mcp={"github_enabled": False, "memory_enabled": False, "fetch_enabled": False},
+    )
+
+
+# Presets are built once and cached. Configurations are immutable, so the
+# cached instance is returned directly; use _override()/dataclasses.replace
+# to derive a variant. The *_readonly() names are kept as aliases.
+
 def get_default_config() -> AgentConfiguration:
     """Get default agent configuration."""
-    return AgentConfiguration()
+    return _build_default_config()
+
+
+def get_default_config_readonly() -> AgentConfiguration:
+    """Alias of get_default_config() (configs are immutable)."""
+    return _build_default_config()
 
 
 def get_conservative_config() -> AgentConfiguration:
     """Get conservative configuration with tighter thresholds."""
-    config = AgentConfiguration()
-    config.settings.mode = AgentOperatingMode.SUPERVISED
-    config.thresholds.trailing_stop_percent = 3.0
-    config.thresholds.btc_crash_threshold_24h = -7.0
-    config.thresholds.rsi_overbought = 65.0
-    config.thresholds.rsi_oversold = 35.0
-    return config
+    return _build_conservative_config()
+
+
+def get_conservative_config_readonly() -> AgentConfiguration:
+    """Alias of get_conservative_config() (configs are immutable)."""
+    return _build_conservative_config()
 
 
 def get_aggressive_config() -> AgentConfiguration:
     """Get aggressive configuration with looser thresholds."""
-    config = AgentConfiguration()
-    config.settings.mode = AgentOperatingMode.AUTONOMOUS
-    config.thresholds.trailing_stop_percent = 8.0
-    config.thresholds.btc_crash_threshold_24h = -15.0
-    config.thresholds.rsi_overbought = 75.0
-    config.thresholds.rsi_oversold = 25.0
-    return config
+    return _build_aggressive_config()
+
+
+def get_aggressive_config_readonly() -> AgentConfiguration:
+    """Alias of get_aggressive_config() (configs are immutable)."""
+    return _build_aggressive_config()
 
 
 def get_testing_config() -> AgentConfiguration:
     """Get configuration for testing (no external calls)."""
-    config = AgentConfiguration()
-    config.settings.mode = AgentOperatingMode.MONITORING
-    config.settings.alert_mode = AlertDeliveryMode.SILENT
-    config.permissions.notifications = False
-    config.mcp.github_enabled = False
-    config.mcp.fetch_enabled = False
-    return config
+    return _build_testing_config()
+
+
+def get_testing_config_readonly() -> AgentConfiguration:
+    """Alias of get_testing_config() (configs are immutable)."""
+    return _build_testing_config()
 
 
 def get_backtest_config() -> AgentConfiguration:
     """Get configuration for backtesting."""
-    config = AgentConfiguration()
-    config.settings.mode = AgentOperatingMode.BACKTESTING
-    config.settings.alert_mode = AlertDeliveryMode.SILENT
-    config.permissions.notifications = False
-    config.permissions.state_write = False
-    config.mcp.github_enabled = False
-    config.mcp.memory_enabled = False
-    config.mcp.fetch_enabled = False
-    return config
+    return _build_backtest_config()
+
+
+def get_backtest_config_readonly() -> AgentConfiguration:
+    """Alias of get_backtest_config() (configs are immutable)."""
+    return _build_backtest_config()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ENVIRONMENT-BASED CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def load_config_from_env() -> AgentConfiguration:
-    """Load configuration from environment variables."""
-    config = AgentConfiguration()
-    
-    # Agent mode
-    mode_str = os.getenv("AGENT_MODE", "autonomous").lower()
-    mode_map = {
-        "autonomous": AgentOperatingMode.AUTONOMOUS,
-        "supervised": AgentOperatingMode.SUPERVISED,
-        "interactive": AgentOperatingMode.INTERACTIVE,
-        "monitoring": AgentOperatingMode.MONITORING,
-        "backtesting": AgentOperatingMode.BACKTESTING,
-    }
-    config.settings.mode = mode_map.get(mode_str, AgentOperatingMode.AUTONOMOUS)
-    
-    # Alert mode
-    alert_str = os.getenv("ALERT_MODE", "immediate").lower()
-    alert_map = {
-        "immediate": AlertDeliveryMode.IMMEDIATE,
-        "batched": AlertDeliveryMode.BATCHED,
-        "digest": AlertDeliveryMode.DIGEST,
-        "silent": AlertDeliveryMode.SILENT,
-    }
-    config.settings.alert_mode = alert_map.get(alert_str, AlertDeliveryMode.IMMEDIATE)
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def _is_truthy(value: str) -> bool:
+    """Parse a boolean env flag ("1", "true", "yes", "on" → True)."""
+    return value.strip().lower() in _TRUTHY
+
+
+def _enum_parser(enum_cls: type[StrEnum], default: StrEnum) -> Callable[[str], StrEnum]:
+    """Build a parser mapping an env string to enum_cls, falling back to default."""
+    def parse(value: str) -> StrEnum:
+        try:
+            return enum_cls(value)
+        except ValueError:
+            return default
+    return parse
+
+
+# (env var, section, field, parser) entries applied by load_config_from_env().
+# Unset or empty variables leave the dataclass default in place.
+_ENV_DISPATCH: tuple[tuple[str, str, str, Callable[[str], Any]], ...] = (
+    # Agent / alert mode
+    ("AGENT_MODE", "settings", "mode",
+     _enum_parser(AgentOperatingMode, AgentOperatingMode.AUTONOMOUS)),
+    ("ALERT_MODE", "settings", "alert_mode",
+     _enum_parser(AlertDeliveryMode, AlertDeliveryMode.IMMEDIATE)),
     
     # Thresholds
-    if os.getenv("TRAILING_STOP_PERCENT"):
-        config.thresholds.trailing_stop_percent = float(os.getenv("TRAILING_STOP_PERCENT"))
-    
-    if os.getenv("BTC_CRASH_THRESHOLD"):
-        config.thresholds.btc_crash_threshold_24h = float(os.getenv("BTC_CRASH_THRESHOLD"))
+    ("TRAILING_STOP_PERCENT", "thresholds", "trailing_stop_percent", float),
+    ("BTC_CRASH_THRESHOLD", "thresholds", "btc_crash_threshold_24h", float),
     
     # MCP settings
-    config.mcp.github_enabled = os.getenv("MCP_GITHUB_ENABLED", "true").lower() == "true"
-    config.mcp.memory_enabled = os.getenv("MCP_MEMORY_ENABLED", "true").lower() == "true"
-    config.mcp.fetch_enabled = os.getenv("MCP_FETCH_ENABLED", "true").lower() == "true"
-    config.mcp.github_repo = os.getenv("GITHUB_REPO", "")
+    ("MCP_GITHUB_ENABLED", "mcp", "github_enabled", _is_truthy),
+    ("MCP_MEMORY_ENABLED", "mcp", "memory_enabled", _is_truthy),
+    ("MCP_FETCH_ENABLED", "mcp", "fetch_enabled", _is_truthy),
+    ("GITHUB_REPO", "mcp", "github_repo", str),
     
     # LLM settings
-    config.llm.provider = os.getenv("LLM_PROVIDER", "none")
-    config.llm.model = os.getenv("LLM_MODEL", "")
-    config.llm.api_key_env_var = os.getenv("LLM_API_KEY_VAR", "")
+    ("LLM_PROVIDER", "llm", "provider", str),
+    ("LLM_MODEL", "llm", "model", str),
+    ("LLM_API_KEY_VAR", "llm", "api_key_env_var", str),
+)
+
+
+# Env vars read by load_config_from_env(); their values fingerprint the cache
+_LCE_KEYS: tuple[str, ...] = tuple(name for name, *_ in _ENV_DISPATCH)
+_lce_cache_key: tuple[str | None, ...] | None = None
+_lce_cache: AgentConfiguration | None = None
+
+
+def load_config_from_env() -> AgentConfiguration:
+    """
+    Load configuration from environment variables.
+    The result is cached until one of the _LCE_KEYS variables changes;
+    configs are immutable, so the cached instance is shared.
+    """
+    global _lce_cache_key, _lce_cache
+    _ensure_env_loaded()
+    env = os.environ
+    
+    key = tuple(env.get(name) for name in _LCE_KEYS)
+    if key == _lce_cache_key and _lce_cache is not None:
+        return _lce_cache
+    
+    overrides: dict[str, dict[str, Any]] = {}
+    for value, (_, section, attr, parse) in zip(key, _ENV_DISPATCH):
+        if value:
+            overrides.setdefault(section, {})[attr] = parse(value)
     
-    return config
+    _lce_cache = _override(AgentConfiguration(), **overrides)
+    _lce_cache_key = key
+    return _lce_cache
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -370,20 +622,28 @@ def load_config_from_env() -> AgentConfiguration:
 # Default configuration instance
 DEFAULT_CONFIG = get_default_config()
 
-__all__ = [
+__all__ = (
     "AgentOperatingMode",
     "AlertDeliveryMode",
     "AgentSettings",
+    "ToolPerm",
     "ToolPermissions",
     "MCPServerSettings",
     "LLMSettings",
     "MonitoringThresholds",
     "AgentConfiguration",
+    "thresholds_with",
+    "THRESHOLD_FIELDS",
     "get_default_config",
     "get_conservative_config",
     "get_aggressive_config",
     "get_testing_config",
     "get_backtest_config",
+    "get_default_config_readonly",
+    "get_conservative_config_readonly",
+    "get_aggressive_config_readonly",
+    "get_testing_config_readonly",
+    "get_backtest_config_readonly",
     "load_config_from_env",
     "DEFAULT_CONFIG",
-]
+)
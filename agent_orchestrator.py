@@ -17,15 +17,28 @@ between technical analysis, macro analysis, and external data sources.
 """
 
 import asyncio
+import functools
 import json
 import logging
+import re
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Optional, Union
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Optional, Union
 from zoneinfo import ZoneInfo
 
+import aiohttp
+
+try:
+    import orjson  # Optional: faster JSON output for the CLI
+except ImportError:
+    orjson = None
+
 from config import (
     BENCHMARK,
     ALL_TICKERS,
@@ -35,21 +48,25 @@ from config import (
     POLYGON_API_KEY,
     FMP_API_KEY,
     TELEGRAM_BOT_TOKEN,
+    POLYGON_RATE_LIMIT_PER_SEC,
 )
 from technical_analysis import (
     analyze_sma,
     analyze_trailing_stop,
     analyze_crypto_canary,
-    fetch_all_prices,
+    fetch_all_prices_async,
     get_current_price,
     MarketSignal,
 )
-from macro_analysis import check_macro_environment, fetch_news_sentiment, fetch_fed_rate
+from macro_analysis import FMP_BUCKET, check_macro_environment, fetch_news_sentiment, fetch_fed_rate
 from notifications import send_alert, send_daily_summary
-from state_manager import load_state, save_state, update_state, get_state_summary
+from state_manager import load_state, commit_delta, get_state_summary
 
 logger = logging.getLogger(__name__)
 
+_ET = ZoneInfo("US/Eastern")
+_TIME_FMT = "%Y-%m-%d %H:%M %Z"
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # DATA MODELS
@@ -66,6 +83,10 @@ class ToolCategory(Enum):
     MEMORY = "memory"
 
 
+_CATEGORIES: tuple[ToolCategory, ...] = tuple(ToolCategory)
+_CATEGORY_TITLES: dict[ToolCategory, str] = {c: c.value.replace("_", " ").title() for c in _CATEGORIES}
+
+
 class AgentMode(Enum):
     """Operating modes for the agent."""
     AUTONOMOUS = "autonomous"      # Agent makes decisions independently
@@ -73,6 +94,14 @@ class AgentMode(Enum):
     INTERACTIVE = "interactive"    # Agent responds to direct queries
 
 
+# API keys a tool can declare in `requires_api_key`, resolved once at registration
+_API_KEYS: dict[str, Optional[str]] = {
+    "POLYGON_API_KEY": POLYGON_API_KEY,
+    "FMP_API_KEY": FMP_API_KEY,
+    "TELEGRAM_BOT_TOKEN": TELEGRAM_BOT_TOKEN,
+}
+
+
 @dataclass
 class ToolDefinition:
     """Definition of a tool available to the agent."""
@@ -83,6 +112,11 @@ class ToolDefinition:
     handler: Callable
     requires_api_key: Optional[str] = None
     rate_limit_per_minute: Optional[int] = None
+    api_key_configured: bool = field(init=False, default=True)
+    
+    def __post_init__(self):
+        if self.requires_api_key:
+            self.api_key_configured = bool(_API_KEYS.get(self.requires_api_key))
 
 
 @dataclass
@@ -94,12 +128,16 @@ class ToolResult:
     execution_time_ms: float = 0.0
 
 
+# Max tool executions retained in AgentContext.execution_history
+MAX_EXECUTION_HISTORY = 1000
+
+
 @dataclass
 class AgentContext:
     """Context for agent execution."""
     mode: AgentMode = AgentMode.AUTONOMOUS
     current_state: dict = field(default_factory=dict)
-    execution_history: list = field(default_factory=list)
+    execution_history: deque = field(default_factory=lambda: deque(maxlen=MAX_EXECUTION_HISTORY))
     memory: dict = field(default_factory=dict)
     active_signals: list = field(default_factory=list)
 
@@ -112,47 +150,168 @@ class AgentDecision:
     tools_to_execute: list[str]
     parameters: dict[str, Any]
     priority: int = 1  # 1=highest, 5=lowest
-    timestamp: datetime = field(default_factory=lambda: datetime.now(ZoneInfo("US/Eastern")))
+    timestamp: datetime = field(default_factory=lambda: datetime.now(_ET))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RATE LIMITING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class AsyncRateLimiter:
+    """Token bucket: allows bursts up to `capacity`, refills at `rate` tokens/second."""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+# All alerts go to the single TELEGRAM_CHAT_ID, which Telegram limits to ~1 msg/s.
+# One semaphore per event loop: an asyncio.Semaphore binds to the first loop
+# that waits on it, and separate asyncio.run() calls each bring their own loop.
+_telegram_sems: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()  # loop -> Semaphore
+
+
+def _telegram_sem() -> asyncio.Semaphore:
+    """Serialize Telegram sends on the running event loop."""
+    loop = asyncio.get_running_loop()
+    sem = _telegram_sems.get(loop)
+    if sem is None:
+        sem = _telegram_sems[loop] = asyncio.Semaphore(1)
+    return sem
+
+
+POLYGON_LIMITER = AsyncRateLimiter(rate=POLYGON_RATE_LIMIT_PER_SEC, capacity=POLYGON_RATE_LIMIT_PER_SEC)
+# FMP is throttled by macro_analysis.FMP_BUCKET, shared with the scheduler jobs
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TOOL REGISTRY
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Max entries kept in the agent's in-process memory store (LRU eviction beyond this)
+MAX_MEMORIES = 10_000
+
+# Failed results are cached briefly so a flapping API isn't hammered
+NEGATIVE_CACHE_TTL_S = 5.0
+
+# Max cached tool results per registry (LRU eviction beyond this)
+TOOL_CACHE_SIZE = 256
+
+
+def _cached(ttl_s: float, per_utc_day: bool = False) -> Callable:
+    """
+    Cache a ToolRegistry handler's ToolResult in `self._cache` for `ttl_s` seconds.
+
+    Entries are keyed by (handler name, call arguments), plus the current UTC
+    date when `per_utc_day` is set (for handlers whose result depends on
+    today's date). Unsuccessful results are kept for NEGATIVE_CACHE_TTL_S only.
+    """
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs) -> ToolResult:
+            key = (fn.__name__, args, frozenset(kwargs.items()))
+            if per_utc_day:
+                key += (datetime.now(timezone.utc).date(),)
+            now = time.monotonic()
+            hit = self._cache.get(key)
+            if hit is not None:
+                expires_at, result = hit
+                if now < expires_at:
+                    self._cache.move_to_end(key)
+                    return result
+                del self._cache[key]
+            result = await fn(self, *args, **kwargs)
+            self._cache[key] = (now + (ttl_s if result.success else NEGATIVE_CACHE_TTL_S), result)
+            if len(self._cache) > TOOL_CACHE_SIZE:
+                self._cache.popitem(last=False)
+            return result
+        return wrapper
+    return decorator
+
+
 class ToolRegistry:
     """Registry of all available tools for the agent."""
     
     def __init__(self):
         self._tools: dict[str, ToolDefinition] = {}
+        # Serializes read-merge-write of the state file so concurrently
+        # running analyses don't clobber each other's updates
+        self._state_lock = asyncio.Lock()
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._cache: OrderedDict[tuple, tuple[float, ToolResult]] = OrderedDict()
+        self._by_category: defaultdict[ToolCategory, list[ToolDefinition]] = defaultdict(list)
+        self._descriptions_cache: Optional[str] = None
+        self.generation = 0  # bumped on every register() so dependents can rebuild
+        self._memory_store: OrderedDict[str, dict] = OrderedDict()
+        # key -> (expires_at, miss result); lets speculative recalls reuse one result
+        self._memory_misses: dict[str, tuple[float, ToolResult]] = {}
         self._register_builtin_tools()
     
+    @property
+    def http_session(self) -> aiohttp.ClientSession:
+        """Shared aiohttp session, created lazily inside the running event loop."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=64),
+            )
+        return self._http_session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+    
     def register(self, tool: ToolDefinition) -> None:
         """Register a new tool."""
+        previous = self._tools.get(tool.name)
+        if previous is not None:
+            self._by_category[previous.category].remove(previous)
         self._tools[tool.name] = tool
+        self._by_category[tool.category].append(tool)
+        self._descriptions_cache = None
+        self.generation += 1
         logger.info(f"Registered tool: {tool.name} ({tool.category.value})")
     
     def get(self, name: str) -> Optional[ToolDefinition]:
         """Get a tool by name."""
         return self._tools.get(name)
     
+    def items(self) -> list[tuple[str, ToolDefinition]]:
+        """All (name, tool) pairs."""
+        return list(self._tools.items())
+    
     def list_tools(self, category: Optional[ToolCategory] = None) -> list[ToolDefinition]:
         """List all tools, optionally filtered by category."""
-        tools = list(self._tools.values())
         if category:
-            tools = [t for t in tools if t.category == category]
-        return tools
+            return self._by_category[category]
+        return list(self._tools.values())
     
     def get_tool_descriptions(self) -> str:
-        """Get formatted descriptions of all tools for LLM context."""
-        lines = ["Available Tools:"]
-        for cat in ToolCategory:
-            cat_tools = self.list_tools(cat)
-            if cat_tools:
-                lines.append(f"\n## {cat.value.replace('_', ' ').title()}")
-                for tool in cat_tools:
-                    params_str = ", ".join(tool.parameters.keys()) if tool.parameters else "none"
-                    lines.append(f"  - {tool.name}: {tool.description} (params: {params_str})")
-        return "\n".join(lines)
+        """Get formatted descriptions of all tools for LLM context (cached until next register)."""
+        if self._descriptions_cache is None:
+            lines = ["Available Tools:"]
+            for cat in _CATEGORIES:
+                cat_tools = self._by_category.get(cat)
+                if cat_tools:
+                    lines.append(f"\n## {_CATEGORY_TITLES[cat]}")
+                    for tool in cat_tools:
+                        params_str = ", ".join(tool.parameters.keys()) if tool.parameters else "none"
+                        lines.append(f"  - {tool.name}: {tool.description} (params: {params_str})")
+            self._descriptions_cache = "\n".join(lines)
+        return self._descriptions_cache
     
     def _register_builtin_tools(self) -> None:
         """Register all built-in market monitoring tools."""
@@ -346,6 +505,59 @@ class ToolRegistry:
     
     # ─── Tool Handler Implementations ────────────────────────────────────────
     
+    async def _commit_state_update(self, state_update: dict) -> None:
+        """Merge an update into the on-disk state (re-read under the lock)."""
+        async with self._state_lock:
+            await asyncio.to_thread(commit_delta, state_update)
+    
+    async def _analyze_with_state(
+        self, analyzers: list[Callable], state: Optional[dict] = None
+    ) -> list[ToolResult]:
+        """
+        Run blocking `analyzer(state)` functions concurrently on one state snapshot.
+        
+        The state is loaded once (unless passed in), every analyzer reads the same
+        snapshot, and their updates are merged and persisted in a single save.
+        Returns one ToolResult per analyzer, in order.
+        """
+        if state is None:
+            state = await asyncio.to_thread(load_state)
+        
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(analyzer, state) for analyzer in analyzers),
+            return_exceptions=True,
+        )
+        
+        merged_update: dict = {}
+        results = []
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                results.append(ToolResult(success=False, data=None, error=str(outcome)))
+                continue
+            signal, state_update = outcome
+            if state_update:
+                merged_update.update(state_update)
+            results.append(ToolResult(
+                success=True,
+                data={
+                    "signal": signal.as_dict if signal else None,
+                    "state_update": state_update,
+                }
+            ))
+        
+        if merged_update:
+            await self._commit_state_update(merged_update)
+        return results
+    
+    async def _run_state_analyzer(self, analyzer: Callable) -> ToolResult:
+        """Run a single state analyzer and persist its update."""
+        try:
+            (result,) = await self._analyze_with_state([analyzer])
+            return result
+        except Exception as e:
+            return ToolResult(success=False, data=None, error=str(e))
+    
+    @_cached(ttl_s=10)
     async def _tool_get_current_price(self, ticker: str) -> ToolResult:
         """Get current price for a ticker."""
         try:
@@ -360,15 +572,17 @@ class ToolRegistry:
         """Fetch all prices."""
         try:
             tickers = tickers or ALL_TICKERS
-            prices = fetch_all_prices(tickers)
+            prices = await fetch_all_prices_async(self.http_session, tickers)
             return ToolResult(success=True, data=prices)
         except Exception as e:
             return ToolResult(success=False, data=None, error=str(e))
     
+    @_cached(ttl_s=60)
     async def _tool_get_market_status(self) -> ToolResult:
         """Check market status."""
         try:
             from polygon_provider import get_market_status
+            await POLYGON_LIMITER.acquire()
             status = get_market_status()
             if status is None:
                 return ToolResult(success=False, data=None, error="Could not fetch market status")
@@ -378,26 +592,13 @@ class ToolRegistry:
     
     async def _tool_analyze_sma(self) -> ToolResult:
         """Analyze SMA."""
-        try:
-            state = load_state()
-            signal, state_update = analyze_sma(state)
-            if state_update:
-                state = update_state(state, state_update)
-                save_state(state)
-            return ToolResult(
-                success=True,
-                data={
-                    "signal": signal.__dict__ if signal else None,
-                    "state_update": state_update,
-                }
-            )
-        except Exception as e:
-            return ToolResult(success=False, data=None, error=str(e))
+        return await self._run_state_analyzer(analyze_sma)
     
     async def _tool_analyze_rsi(self, ticker: str = "SPY") -> ToolResult:
         """Analyze RSI."""
         try:
             from polygon_provider import get_rsi
+            await POLYGON_LIMITER.acquire()
             rsi = get_rsi(ticker)
             if rsi is None:
                 return ToolResult(success=False, data=None, error=f"Could not fetch RSI for {ticker}")
@@ -418,48 +619,19 @@ class ToolRegistry:
     
     async def _tool_analyze_trailing_stop(self) -> ToolResult:
         """Analyze trailing stop."""
-        try:
-            state = load_state()
-            signal, state_update = analyze_trailing_stop(state)
-            if state_update:
-                state = update_state(state, state_update)
-                save_state(state)
-            return ToolResult(
-                success=True,
-                data={
-                    "signal": signal.__dict__ if signal else None,
-                    "state_update": state_update,
-                }
-            )
-        except Exception as e:
-            return ToolResult(success=False, data=None, error=str(e))
+        return await self._run_state_analyzer(analyze_trailing_stop)
     
     async def _tool_analyze_crypto_canary(self) -> ToolResult:
         """Analyze crypto canary."""
-        try:
-            state = load_state()
-            signal, state_update = analyze_crypto_canary(state)
-            if state_update:
-                state = update_state(state, state_update)
-                save_state(state)
-            return ToolResult(
-                success=True,
-                data={
-                    "signal": signal.__dict__ if signal else None,
-                    "state_update": state_update,
-                }
-            )
-        except Exception as e:
-            return ToolResult(success=False, data=None, error=str(e))
+        return await self._run_state_analyzer(analyze_crypto_canary)
     
     async def _tool_run_full_technical_analysis(self) -> ToolResult:
         """Run full technical analysis."""
         try:
-            results = {
-                "sma": await self._tool_analyze_sma(),
-                "trailing_stop": await self._tool_analyze_trailing_stop(),
-                "crypto_canary": await self._tool_analyze_crypto_canary(),
-            }
+            names = ("sma", "trailing_stop", "crypto_canary")
+            results = dict(zip(names, await self._analyze_with_state(
+                [analyze_sma, analyze_trailing_stop, analyze_crypto_canary]
+            )))
             
             signals = []
             for name, result in results.items():
@@ -477,11 +649,11 @@ class ToolRegistry:
     async def _tool_analyze_news_sentiment(self) -> ToolResult:
         """Analyze news sentiment."""
         try:
-            signal, state_update = fetch_news_sentiment()
+            signal, state_update = await asyncio.to_thread(fetch_news_sentiment)
             return ToolResult(
                 success=True,
                 data={
-                    "signal": signal.__dict__ if signal else None,
+                    "signal": signal.as_dict if signal else None,
                     "state_update": state_update,
                 }
             )
@@ -490,34 +662,21 @@ class ToolRegistry:
     
     async def _tool_check_fed_rate(self) -> ToolResult:
         """Check Fed rate."""
-        try:
-            state = load_state()
-            signal, state_update = fetch_fed_rate(state)
-            if state_update:
-                state = update_state(state, state_update)
-                save_state(state)
-            return ToolResult(
-                success=True,
-                data={
-                    "signal": signal.__dict__ if signal else None,
-                    "state_update": state_update,
-                }
-            )
-        except Exception as e:
-            return ToolResult(success=False, data=None, error=str(e))
+        # No token here: fetch_fed_rate takes one itself, and only when the
+        # calendar isn't served from its disk cache
+        return await self._run_state_analyzer(fetch_fed_rate)
     
     async def _tool_run_macro_analysis(self) -> ToolResult:
         """Run macro analysis."""
         try:
-            state = load_state()
-            signals, state_update = check_macro_environment(state)
+            state = await asyncio.to_thread(load_state)
+            signals, state_update = await asyncio.to_thread(check_macro_environment, state)
             if state_update:
-                state = update_state(state, state_update)
-                save_state(state)
+                await self._commit_state_update(state_update)
             return ToolResult(
                 success=True,
                 data={
-                    "signals": [s.__dict__ for s in signals] if signals else [],
+                    "signals": [s.as_dict for s in signals] if signals else [],
                     "state_update": state_update,
                 }
             )
@@ -527,7 +686,8 @@ class ToolRegistry:
     async def _tool_send_alert(self, subject: str, body: str, level: str = "INFO") -> ToolResult:
         """Send alert."""
         try:
-            result = send_alert(subject=subject, body=body, level=level)
+            async with _telegram_sem():
+                result = await asyncio.to_thread(send_alert, subject=subject, body=body, level=level)
             return ToolResult(success=result.get("telegram", False), data=result)
         except Exception as e:
             return ToolResult(success=False, data=None, error=str(e))
@@ -560,9 +720,7 @@ class ToolRegistry:
     async def _tool_update_state(self, updates: dict) -> ToolResult:
         """Update state."""
         try:
-            state = load_state()
-            state = update_state(state, updates)
-            save_state(state)
+            state = await asyncio.to_thread(commit_delta, updates)
             return ToolResult(success=True, data=state)
         except Exception as e:
             return ToolResult(success=False, data=None, error=str(e))
@@ -579,16 +737,16 @@ class ToolRegistry:
             }
         )
     
+    @_cached(ttl_s=86400, per_utc_day=True)
     async def _tool_get_economic_calendar(self, days_ahead: int = 7) -> ToolResult:
         """Get economic calendar."""
         try:
             from datetime import timedelta
-            import requests
             
             if not FMP_API_KEY:
                 return ToolResult(success=False, data=None, error="FMP_API_KEY not configured")
             
-            today = datetime.utcnow()
+            today = datetime.now(timezone.utc)
             end_date = today + timedelta(days=days_ahead)
             
             url = f"https://financialmodelingprep.com/api/v3/economic_calendar"
@@ -598,9 +756,12 @@ class ToolRegistry:
                 "apikey": FMP_API_KEY,
             }
             
-            response = requests.get(url, params=params, timeout=15)
-            response.raise_for_status()
-            events = response.json()
+            await asyncio.to_thread(FMP_BUCKET.acquire)
+            async with self.http_session.get(
+                url, params=params, timeout=aiohttp.ClientTimeout(total=15)
+            ) as response:
+                response.raise_for_status()
+                events = await response.json()
             
             return ToolResult(success=True, data={
                 "events": events[:20],  # Limit to 20 events
@@ -609,22 +770,35 @@ class ToolRegistry:
         except Exception as e:
             return ToolResult(success=False, data=None, error=str(e))
     
-    # Memory tool implementations using in-memory storage
-    _memory_store: dict = {}
+    # Memory tool implementations using a bounded in-memory LRU (per registry)
     
     async def _tool_store_memory(self, key: str, value: Any) -> ToolResult:
         """Store in memory."""
         self._memory_store[key] = {
             "value": value,
-            "stored_at": datetime.now(ZoneInfo("US/Eastern")).isoformat(),
+            "stored_at": datetime.now(_ET).isoformat(),
         }
+        self._memory_store.move_to_end(key)
+        if len(self._memory_store) > MAX_MEMORIES:
+            self._memory_store.popitem(last=False)
+        self._memory_misses.pop(key, None)
         return ToolResult(success=True, data={"key": key, "stored": True})
     
     async def _tool_recall_memory(self, key: str) -> ToolResult:
         """Recall from memory."""
         if key in self._memory_store:
+            self._memory_store.move_to_end(key)
             return ToolResult(success=True, data=self._memory_store[key])
-        return ToolResult(success=False, data=None, error=f"Key '{key}' not found in memory")
+        
+        now = time.monotonic()
+        miss = self._memory_misses.get(key)
+        if miss is not None and now < miss[0]:
+            return miss[1]
+        if len(self._memory_misses) >= MAX_MEMORIES:
+            self._memory_misses.clear()
+        result = ToolResult(success=False, data=None, error=f"Key '{key}' not found in memory")
+        self._memory_misses[key] = (now + NEGATIVE_CACHE_TTL_S, result)
+        return result
     
     async def _tool_list_memories(self) -> ToolResult:
         """List all memories."""
@@ -638,6 +812,107 @@ class ToolRegistry:
 # AGENT ORCHESTRATOR
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Query keyword routes in priority order: the first route with any keyword in the query wins
+_DISPATCH_TABLE: tuple[tuple[frozenset[str], str], ...] = (
+    (frozenset({"price", "quote", "cost"}), "get_current_price"),
+    (frozenset({"sma", "moving average", "trend"}), "analyze_sma"),
+    (frozenset({"rsi", "overbought", "oversold"}), "analyze_rsi"),
+    (frozenset({"crypto", "bitcoin", "btc", "eth"}), "analyze_crypto_canary"),
+    (frozenset({"news", "sentiment"}), "analyze_news_sentiment"),
+    (frozenset({"fed", "rate", "fomc"}), "check_fed_rate"),
+    (frozenset({"state", "status", "summary"}), "get_state_summary"),
+    (frozenset({"calendar", "events", "upcoming"}), "get_economic_calendar"),
+    (frozenset({"health", "check", "full", "complete"}), "run_market_health_check"),
+    (frozenset({"tools", "help", "available"}), "list_tools"),
+)
+
+# keyword -> (priority, route); multi-word keywords are stored space-joined
+_KEYWORD_TO_ROUTE: dict[str, tuple[int, str]] = {
+    keyword: (priority, route)
+    for priority, (keywords, route) in enumerate(_DISPATCH_TABLE)
+    for keyword in keywords
+}
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# handle_query response cache: paraphrased queries routed to the same tool within
+# one time bucket reuse the previous result instead of re-running the tool
+RESPONSE_CACHE_SIZE = 128
+
+# Max age of the state snapshot served to unmatched queries before it is re-read,
+# and of a prefetched tool run before it is discarded in favour of a fresh one
+SNAPSHOT_REFRESH_S = 15
+DEFAULT_RESPONSE_TTL_S = 30
+_RESPONSE_TTL_S: dict[str, int] = {
+    "get_economic_calendar": 300,
+}
+
+
+# Independent analysis pipelines run concurrently by run_market_health_check: (section, tool).
+# The per-signal tools (RSI aside) are covered by these pipelines, so they aren't listed again.
+_HEALTH_TOOLS: tuple[tuple[str, str], ...] = (
+    ("technical", "run_full_technical_analysis"),
+    ("macro", "run_macro_analysis"),
+)
+
+# Recommended MCP servers (static; shared by every call, so read-only views)
+_MCP_SERVERS: tuple[MappingProxyType, ...] = (
+    MappingProxyType({
+        "name": "github",
+        "description": "Access GitHub for tracking market-related repositories, issues, and code",
+        "tools": (
+            "github_search_code",
+            "github_search_issues",
+            "github_get_file_contents",
+            "github_create_issue",
+        ),
+        "use_cases": (
+            "Track market monitoring tool updates",
+            "File bugs and feature requests",
+            "Collaborate on strategy improvements",
+        ),
+    }),
+    MappingProxyType({
+        "name": "memory",
+        "description": "Persistent memory for tracking market patterns over time",
+        "tools": (
+            "create_entities",
+            "add_observations",
+            "search_nodes",
+            "read_graph",
+        ),
+        "use_cases": (
+            "Remember significant market events",
+            "Track pattern occurrences",
+            "Build knowledge graph of market relationships",
+        ),
+    }),
+    MappingProxyType({
+        "name": "fetch",
+        "description": "Fetch data from external web sources",
+        "tools": (
+            "fetch_webpage",
+        ),
+        "use_cases": (
+            "Get real-time news from financial sites",
+            "Fetch Fed announcements",
+            "Monitor MarketWatch, Bloomberg, Reuters",
+        ),
+    }),
+    MappingProxyType({
+        "name": "sequential_thinking",
+        "description": "Complex multi-step reasoning for market analysis",
+        "tools": (
+            "sequentialthinking",
+        ),
+        "use_cases": (
+            "Analyze complex market scenarios",
+            "Build investment theses",
+            "Reason through multi-signal situations",
+        ),
+    }),
+)
+
+
 class AgentOrchestrator:
     """
     Main AI Agent Orchestrator for Market Monitor.
@@ -654,43 +929,95 @@ class AgentOrchestrator:
         self.registry = ToolRegistry()
         self.context = AgentContext(mode=mode)
         self._running = False
+        
+        # Query routing patterns, compiled once
+        self._ticker_map = {t.lower(): t for t in ALL_TICKERS}
+        self._ticker_pattern = re.compile(
+            r"\b(" + "|".join(re.escape(t) for t in self._ticker_map) + r")\b"
+        )
+        
+        self._system_prompt_cache: Optional[tuple[int, str]] = None  # (registry generation, prompt)
+        
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        self._response_cache: OrderedDict[tuple, Any] = OrderedDict()
+        self._state_snapshot: Optional[Any] = None
+        self._snapshot_at = 0.0  # time.monotonic() of the last snapshot refresh
+        self._fast_dispatch: dict[str, Callable[..., Awaitable[ToolResult]]] = {}
+        self._dispatch_generation = -1
+        self._build_dispatch()
         logger.info(f"Agent Orchestrator initialized in {mode.value} mode")
     
-    async def execute_tool(self, tool_name: str, **kwargs) -> ToolResult:
-        """Execute a single tool by name."""
-        tool = self.registry.get(tool_name)
-        if not tool:
-            return ToolResult(success=False, data=None, error=f"Tool '{tool_name}' not found")
+    async def close(self) -> None:
+        """Release resources held by the tool registry."""
+        await self.registry.close()
+    
+    def _build_dispatch(self) -> None:
+        """(Re)build the per-tool executors from the registry."""
+        self._fast_dispatch = {name: self._make_executor(tool) for name, tool in self.registry.items()}
+        self._dispatch_generation = self.registry.generation
+    
+    def _make_executor(self, tool: ToolDefinition) -> Callable[..., Awaitable[ToolResult]]:
+        """Bind a tool's handler, API-key check and history sink into one closure."""
+        tool_name = tool.name
+        handler = tool.handler
         
-        # Check API key requirements
-        if tool.requires_api_key:
-            api_key = globals().get(tool.requires_api_key) or locals().get(tool.requires_api_key)
-            if not api_key:
-                return ToolResult(
-                    success=False,
-                    data=None,
-                    error=f"Tool '{tool_name}' requires {tool.requires_api_key} to be configured"
-                )
+        if not tool.api_key_configured:
+            error = f"Tool '{tool_name}' requires {tool.requires_api_key} to be configured"
+            
+            async def missing_key(**kwargs) -> ToolResult:
+                return ToolResult(success=False, data=None, error=error)
+            return missing_key
         
-        # Execute the tool
-        start_time = datetime.now()
+        async def execute(**kwargs) -> ToolResult:
+            started_at = datetime.now(_ET).isoformat()
+            start_ns = time.perf_counter_ns()
+            try:
+                result = await handler(**kwargs)
+                result.execution_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
+                
+                # Log execution
+                self.context.execution_history.append({
+                    "tool": tool_name,
+                    "params": kwargs,
+                    "success": result.success,
+                    "timestamp": started_at,
+                    "execution_time_ms": result.execution_time_ms,
+                })
+                
+                return result
+            except Exception as e:
+                logger.error(f"Tool execution failed: {tool_name} - {e}")
+                return ToolResult(success=False, data=None, error=str(e))
+        return execute
+    
+    async def execute_tool(self, tool_name: str, **kwargs) -> ToolResult:
+        """
+        Execute a single tool by name.
+        
+        Concurrent calls with identical (hashable) arguments share one in-flight
+        execution. The shared run is shielded, so a cancelled caller doesn't
+        cancel it for the others.
+        """
         try:
-            result = await tool.handler(**kwargs)
-            result.execution_time_ms = (datetime.now() - start_time).total_seconds() * 1000
-            
-            # Log execution
-            self.context.execution_history.append({
-                "tool": tool_name,
-                "params": kwargs,
-                "success": result.success,
-                "timestamp": start_time.isoformat(),
-                "execution_time_ms": result.execution_time_ms,
-            })
-            
-            return result
-        except Exception as e:
-            logger.error(f"Tool execution failed: {tool_name} - {e}")
-            return ToolResult(success=False, data=None, error=str(e))
+            key = (tool_name, frozenset(kwargs.items()))
+            task = self._inflight.get(key)
+        except TypeError:  # unhashable kwargs (e.g. dict/list) — no coalescing
+            return await self._execute_tool_impl(tool_name, **kwargs)
+        
+        if task is None:
+            task = asyncio.ensure_future(self._execute_tool_impl(tool_name, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+    
+    async def _execute_tool_impl(self, tool_name: str, **kwargs) -> ToolResult:
+        """Execute a tool without coalescing."""
+        if self._dispatch_generation != self.registry.generation:
+            self._build_dispatch()
+        executor = self._fast_dispatch.get(tool_name)
+        if executor is None:
+            return ToolResult(success=False, data=None, error=f"Tool '{tool_name}' not found")
+        return await executor(**kwargs)
     
     async def run_market_health_check(self) -> dict[str, Any]:
         """
@@ -700,38 +1027,44 @@ class AgentOrchestrator:
         logger.info("═══ Running Agent Market Health Check ═══")
         
         results = {
-            "timestamp": datetime.now(ZoneInfo("US/Eastern")).isoformat(),
+            "timestamp": datetime.now(_ET).isoformat(),
             "analysis": {},
             "signals": [],
             "actions_taken": [],
         }
         
-        # 1. Technical Analysis
-        tech_result = await self.execute_tool("run_full_technical_analysis")
-        results["analysis"]["technical"] = tech_result.data
-        if tech_result.success and tech_result.data:
-            results["signals"].extend(tech_result.data.get("signals", []))
-        
-        # 2. Macro Analysis
-        macro_result = await self.execute_tool("run_macro_analysis")
-        results["analysis"]["macro"] = macro_result.data
-        if macro_result.success and macro_result.data:
-            results["signals"].extend(macro_result.data.get("signals", []))
+        # 1-2. Analysis pipelines are independent — run them concurrently
+        outcomes = await asyncio.gather(
+            *(self.execute_tool(tool) for _, tool in _HEALTH_TOOLS),
+            return_exceptions=True,
+        )
+        for (section, _), outcome in zip(_HEALTH_TOOLS, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Health check {section} analysis failed: {outcome}")
+                results["analysis"][section] = None
+                continue
+            results["analysis"][section] = outcome.data
+            if outcome.success and outcome.data:
+                results["signals"].extend(outcome.data.get("signals", []))
         
         # 3. Process signals and take actions
-        for signal in results["signals"]:
-            if signal.get("level") in ["CRITICAL", "WARNING"]:
-                alert_result = await self.execute_tool(
-                    "send_alert",
-                    subject=signal.get("name", "Market Signal"),
-                    body=signal.get("message", "No details"),
-                    level=signal.get("level", "INFO"),
-                )
-                results["actions_taken"].append({
-                    "action": "send_alert",
-                    "signal": signal.get("name"),
-                    "success": alert_result.success,
-                })
+        alert_signals = [s for s in results["signals"] if s.get("level") in {"CRITICAL", "WARNING"}]
+        alert_coros = [
+            self.execute_tool(
+                "send_alert",
+                subject=signal.get("name", "Market Signal"),
+                body=signal.get("message", "No details"),
+                level=signal.get("level", "INFO"),
+            )
+            for signal in alert_signals
+        ]
+        alert_results = await asyncio.gather(*alert_coros, return_exceptions=True)
+        for signal, alert_result in zip(alert_signals, alert_results):
+            results["actions_taken"].append({
+                "action": "send_alert",
+                "signal": signal.get("name"),
+                "success": not isinstance(alert_result, BaseException) and alert_result.success,
+            })
         
         # 4. Update context
         self.context.active_signals = results["signals"]
@@ -739,69 +1072,121 @@ class AgentOrchestrator:
         
         return results
     
-    async def handle_query(self, query: str) -> dict[str, Any]:
+    def _route(self, query_lower: str) -> Optional[str]:
+        """
+        Pick the highest-priority route with a keyword among the query's words.
+        
+        One dict probe per word, plus a plural-stripped probe ("prices") and a
+        two-word probe ("moving average") only when the word itself misses.
+        """
+        tokens = _TOKEN_RE.findall(query_lower)
+        best = None
+        for i, tok in enumerate(tokens):
+            hit = _KEYWORD_TO_ROUTE.get(tok)
+            if hit is None and tok.endswith("s"):
+                hit = _KEYWORD_TO_ROUTE.get(tok[:-1])
+            if hit is None and i + 1 < len(tokens):
+                hit = _KEYWORD_TO_ROUTE.get(f"{tok} {tokens[i + 1]}")
+            if hit is not None and (best is None or hit < best):
+                best = hit
+        return best[1] if best else None
+    
+    async def _run_tool(
+        self, tool_name: str, prefetched: Optional[dict[str, tuple[float, asyncio.Task]]]
+    ) -> ToolResult:
+        """
+        Use a speculatively started run of `tool_name` if there is one younger
+        than SNAPSHOT_REFRESH_S, else execute it.
+        """
+        started_at, task = prefetched.pop(tool_name, (0.0, None)) if prefetched else (0.0, None)
+        if task is not None:
+            if not task.cancelled() and time.monotonic() - started_at <= SNAPSHOT_REFRESH_S:
+                return await task
+            task.cancel()
+        return await self.execute_tool(tool_name)
+    
+    async def _cached_response(
+        self, tool_used: str, run: Callable[[], Awaitable[Any]], args: tuple = ()
+    ) -> Any:
+        """Return `run()`'s result, reusing one from the same (tool, args, time bucket)."""
+        ttl = _RESPONSE_TTL_S.get(tool_used, DEFAULT_RESPONSE_TTL_S)
+        key = (tool_used, args, int(time.time() // ttl))
+        if key in self._response_cache:
+            self._response_cache.move_to_end(key)
+            return self._response_cache[key]
+        
+        data = await run()
+        if data is not None:
+            self._response_cache[key] = data
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return data
+    
+    async def _tool_data(self, tool_name: str, **kwargs) -> Any:
+        return (await self.execute_tool(tool_name, **kwargs)).data
+    
+    async def handle_query(
+        self, query: str, prefetched: Optional[dict[str, tuple[float, asyncio.Task]]] = None
+    ) -> dict[str, Any]:
         """
         Handle a natural language query from the user.
         Routes to appropriate tools based on query content.
+        
+        Args:
+            query: The user's query.
+            prefetched: Optional tool name -> (time.monotonic() it started,
+                task already running that tool with no kwargs); a matching
+                route awaits it instead of re-running unless it is stale.
         """
         query_lower = query.lower()
+        route = self._route(query_lower)
         
         # Simple keyword-based routing (can be enhanced with LLM)
-        if any(word in query_lower for word in ["price", "quote", "cost"]):
+        if route == "get_current_price":
             # Extract ticker if mentioned
-            for ticker in ALL_TICKERS:
-                if ticker.lower() in query_lower:
-                    result = await self.execute_tool("get_current_price", ticker=ticker)
-                    return {"query": query, "result": result.data, "tool_used": "get_current_price"}
+            m = self._ticker_pattern.search(query_lower)
+            if m:
+                ticker = self._ticker_map[m.group(1)]
+                data = await self._cached_response(
+                    "get_current_price",
+                    lambda: self._tool_data("get_current_price", ticker=ticker),
+                    args=(ticker,),
+                )
+                return {"query": query, "result": data, "tool_used": "get_current_price"}
             # Default to all prices
-            result = await self.execute_tool("fetch_all_prices")
-            return {"query": query, "result": result.data, "tool_used": "fetch_all_prices"}
-        
-        elif any(word in query_lower for word in ["sma", "moving average", "trend"]):
-            result = await self.execute_tool("analyze_sma")
-            return {"query": query, "result": result.data, "tool_used": "analyze_sma"}
-        
-        elif any(word in query_lower for word in ["rsi", "overbought", "oversold"]):
-            result = await self.execute_tool("analyze_rsi")
-            return {"query": query, "result": result.data, "tool_used": "analyze_rsi"}
-        
-        elif any(word in query_lower for word in ["crypto", "bitcoin", "btc", "eth"]):
-            result = await self.execute_tool("analyze_crypto_canary")
-            return {"query": query, "result": result.data, "tool_used": "analyze_crypto_canary"}
+            data = await self._cached_response("fetch_all_prices", lambda: self._tool_data("fetch_all_prices"))
+            return {"query": query, "result": data, "tool_used": "fetch_all_prices"}
         
-        elif any(word in query_lower for word in ["news", "sentiment"]):
-            result = await self.execute_tool("analyze_news_sentiment")
-            return {"query": query, "result": result.data, "tool_used": "analyze_news_sentiment"}
-        
-        elif any(word in query_lower for word in ["fed", "rate", "fomc"]):
-            result = await self.execute_tool("check_fed_rate")
-            return {"query": query, "result": result.data, "tool_used": "check_fed_rate"}
-        
-        elif any(word in query_lower for word in ["state", "status", "summary"]):
-            result = await self.execute_tool("get_state_summary")
-            return {"query": query, "result": result.data, "tool_used": "get_state_summary"}
-        
-        elif any(word in query_lower for word in ["calendar", "events", "upcoming"]):
-            result = await self.execute_tool("get_economic_calendar")
-            return {"query": query, "result": result.data, "tool_used": "get_economic_calendar"}
-        
-        elif any(word in query_lower for word in ["health", "check", "full", "complete"]):
-            result = await self.run_market_health_check()
+        elif route == "run_market_health_check":
+            result = await self._cached_response("run_market_health_check", self.run_market_health_check)
             return {"query": query, "result": result, "tool_used": "run_market_health_check"}
         
-        elif any(word in query_lower for word in ["tools", "help", "available"]):
+        elif route == "list_tools":
             return {
                 "query": query,
                 "result": self.registry.get_tool_descriptions(),
                 "tool_used": "list_tools",
             }
         
+        elif route is not None:
+            async def run() -> Any:
+                return (await self._run_tool(route, prefetched)).data
+            data = await self._cached_response(route, run)
+            return {"query": query, "result": data, "tool_used": route}
+        
         else:
-            # Default: run state summary
-            result = await self.execute_tool("get_state_summary")
+            # Default: serve the state snapshot, re-reading it once it is stale
+            if self._state_snapshot is None or time.monotonic() - self._snapshot_at > SNAPSHOT_REFRESH_S:
+                result = await self._run_tool("get_state_summary", prefetched)
+                if result.success:
+                    self._state_snapshot = result.data
+                    self._snapshot_at = time.monotonic()
+                data = result.data
+            else:
+                data = self._state_snapshot
             return {
                 "query": query,
-                "result": result.data,
+                "result": data,
                 "tool_used": "get_state_summary",
                 "note": "Query not matched to specific tool, showing current state",
             }
@@ -810,7 +1195,21 @@ class AgentOrchestrator:
         """
         Get the system prompt for LLM integration.
         This can be used with OpenAI, Anthropic, or other LLM providers.
+        
+        The prompt is byte-identical across calls (until a tool is registered) so
+        provider-side prompt caching can hit; send get_time_context() as a
+        separate message instead.
         """
+        generation = self.registry.generation
+        if self._system_prompt_cache is None or self._system_prompt_cache[0] != generation:
+            self._system_prompt_cache = (generation, self._build_system_prompt())
+        return self._system_prompt_cache[1]
+    
+    def get_time_context(self) -> str:
+        """Current Eastern time, to be sent alongside (not inside) the system prompt."""
+        return f"Current Time: {datetime.now(_ET).strftime(_TIME_FMT)}"
+    
+    def _build_system_prompt(self) -> str:
         tool_descriptions = self.registry.get_tool_descriptions()
         
         return f"""You are an AI Market Monitor Agent specialized in financial market analysis.
@@ -840,77 +1239,47 @@ You are implementing a "Core vs. Defense" investment strategy:
 3. Prioritize risk warnings over opportunity alerts
 4. Consider market hours when interpreting data (9:30-16:00 ET)
 5. Cross-reference technical and macro signals for stronger conviction
-
-Current Time: {datetime.now(ZoneInfo("US/Eastern")).strftime("%Y-%m-%d %H:%M %Z")}
 """
     
-    def get_available_mcp_servers(self) -> list[dict]:
+    def get_available_mcp_servers(self) -> tuple[MappingProxyType, ...]:
         """
         List of recommended MCP servers for expanded monitoring.
-        These can be configured in the MCP settings.
+        These can be configured in the MCP settings. The entries are shared,
+        read-only mappings; copy one with dict() to modify it.
         """
-        return [
-            {
-                "name": "github",
-                "description": "Access GitHub for tracking market-related repositories, issues, and code",
-                "tools": [
-                    "github_search_code",
-                    "github_search_issues",
-                    "github_get_file_contents",
-                    "github_create_issue",
-                ],
-                "use_cases": [
-                    "Track market monitoring tool updates",
-                    "File bugs and feature requests",
-                    "Collaborate on strategy improvements",
-                ],
-            },
-            {
-                "name": "memory",
-                "description": "Persistent memory for tracking market patterns over time",
-                "tools": [
-                    "create_entities",
-                    "add_observations",
-                    "search_nodes",
-                    "read_graph",
-                ],
-                "use_cases": [
-                    "Remember significant market events",
-                    "Track pattern occurrences",
-                    "Build knowledge graph of market relationships",
-                ],
-            },
-            {
-                "name": "fetch",
-                "description": "Fetch data from external web sources",
-                "tools": [
-                    "fetch_webpage",
-                ],
-                "use_cases": [
-                    "Get real-time news from financial sites",
-                    "Fetch Fed announcements",
-                    "Monitor MarketWatch, Bloomberg, Reuters",
-                ],
-            },
-            {
-                "name": "sequential_thinking",
-                "description": "Complex multi-step reasoning for market analysis",
-                "tools": [
-                    "sequentialthinking",
-                ],
-                "use_cases": [
-                    "Analyze complex market scenarios",
-                    "Build investment theses",
-                    "Reason through multi-signal situations",
-                ],
-            },
-        ]
+        return _MCP_SERVERS
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CLI INTERFACE
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+
+
+def _to_json(obj: Any) -> str:
+    """
+    Pretty-print a result as JSON, with orjson when installed.
+
+    Both paths write NumPy float64 scalars as numbers and fall back to str()
+    for other unknown types. They differ at the edges: orjson also writes
+    other NumPy scalars as numbers and NaN/inf as null, where json writes
+    them as strings and bare NaN/Infinity respectively.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=(
+                orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_SERIALIZE_NUMPY
+            ),
+        ).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
 async def interactive_mode():
     """Run the agent in interactive mode."""
     agent = AgentOrchestrator(mode=AgentMode.INTERACTIVE)
@@ -921,28 +1290,39 @@ async def interactive_mode():
     print("\nType 'help' for available commands, 'quit' to exit.\n")
     
     while True:
+        # Speculatively warm the state summary (the default route) while the user types
+        prefetched = {
+            "get_state_summary": (time.monotonic(), asyncio.create_task(agent.execute_tool("get_state_summary"))),
+        }
         try:
-            query = input("Agent> ").strip()
+            # input() runs in a worker thread so the event loop keeps serving the prefetch
+            query = (await asyncio.to_thread(input, "Agent> ")).strip()
             
             if not query:
                 continue
             
-            if query.lower() in ["quit", "exit", "q"]:
+            command = query.lower()
+            if command in _QUIT_COMMANDS:
                 print("Goodbye!")
                 break
             
-            if query.lower() == "help":
+            if command == "help":
                 print(agent.registry.get_tool_descriptions())
                 continue
             
-            result = await agent.handle_query(query)
-            print(f"\n{json.dumps(result, indent=2, default=str)}\n")
+            result = await agent.handle_query(query, prefetched=prefetched)
+            print(f"\n{_to_json(result)}\n")
             
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\nGoodbye!")
             break
         except Exception as e:
             print(f"Error: {e}")
+        finally:
+            for _, task in prefetched.values():
+                task.cancel()
+    
+    await agent.close()
 
 
 def main():
@@ -955,8 +1335,11 @@ def main():
         # Default: run a single health check
         async def single_check():
             agent = AgentOrchestrator()
-            result = await agent.run_market_health_check()
-            print(json.dumps(result, indent=2, default=str))
+            try:
+                result = await agent.run_market_health_check()
+            finally:
+                await agent.close()
+            print(_to_json(result))
         
         asyncio.run(single_check())
 
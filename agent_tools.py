@@ -11,7 +11,9 @@ Use this module to add new market monitoring capabilities without modifying
 the core orchestrator.
 """
 
+import asyncio
 import logging
+import string
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -19,17 +21,20 @@ from typing import Any, Callable, Optional
 from zoneinfo import ZoneInfo
 from enum import Enum
 
+import numpy as np
 import requests
 import pandas as pd
 
+from analytics_kernels import col_stats, compute_risk, drawdown_pass, regime_pass, vol_pass
+from price_cache import cached_download, period_start
 from config import (
     POLYGON_API_KEY,
     FMP_API_KEY,
     BENCHMARK,
     ALL_TICKERS,
-    CORE_PORTFOLIO,
-    DEFENSIVE_INCOME,
-    CRYPTO_CANARIES,
+    CORE_PORTFOLIO_SET,
+    DEFENSIVE_INCOME_SET,
+    CRYPTO_CANARIES_SET,
     SMA_PERIOD,
     RSI_PERIOD,
     RSI_OVERBOUGHT,
@@ -38,6 +43,32 @@ from config import (
 
 logger = logging.getLogger(__name__)
 
+# Exposure category per configured ticker. Built lowest-priority first so a
+# ticker listed in several groups keeps the category the old if/elif chain
+# gave it (core > defensive > crypto).
+_CATEGORY_BY_TICKER: dict[str, str] = {
+    **{t: "crypto" for t in CRYPTO_CANARIES_SET},
+    **{t: "defensive" for t in DEFENSIVE_INCOME_SET},
+    **{t: "core" for t in CORE_PORTFOLIO_SET},
+    BENCHMARK: "core",
+}
+
+
+# Sector ETFs
+_SECTOR_ETFS = {
+    "XLK": "Technology",
+    "XLF": "Financials",
+    "XLV": "Healthcare",
+    "XLE": "Energy",
+    "XLY": "Consumer Discretionary",
+    "XLP": "Consumer Staples",
+    "XLI": "Industrials",
+    "XLB": "Materials",
+    "XLU": "Utilities",
+    "XLRE": "Real Estate",
+    "XLC": "Communication Services",
+}
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CUSTOM TOOL DEFINITIONS
@@ -68,14 +99,10 @@ class CustomTools:
         }
         
         for ticker, allocation in holdings.items():
-            if ticker in CORE_PORTFOLIO or ticker == BENCHMARK:
-                exposure["core"] += allocation
-            elif ticker in DEFENSIVE_INCOME:
-                exposure["defensive"] += allocation
-            elif ticker in CRYPTO_CANARIES or "-USD" in ticker:
-                exposure["crypto"] += allocation
-            else:
-                exposure["other"] += allocation
+            category = _CATEGORY_BY_TICKER.get(ticker)
+            if category is None:
+                category = "crypto" if "-USD" in ticker else "other"
+            exposure[category] += allocation
         
         # Calculate risk score (0-100)
         risk_score = (
@@ -106,18 +133,11 @@ class CustomTools:
             Correlation matrix and insights
         """
         try:
-            import yfinance as yf
-            
             end_date = datetime.now()
             start_date = end_date - timedelta(days=period_days)
             
-            # Download data for all tickers
-            data = yf.download(
-                tickers,
-                start=start_date,
-                end=end_date,
-                progress=False,
-            )["Close"]
+            # Closes for all tickers (one batched download for any not cached)
+            data = await cached_download(tickers, start=start_date, end=end_date)
             
             if data.empty:
                 return {"error": "Could not fetch data for correlation analysis"}
@@ -125,21 +145,25 @@ class CustomTools:
             # Calculate correlation matrix
             correlation = data.pct_change().corr()
             
-            # Find highly correlated pairs
-            high_correlation_pairs = []
-            for i, t1 in enumerate(tickers):
-                for t2 in tickers[i+1:]:
-                    if t1 in correlation.columns and t2 in correlation.columns:
-                        corr_value = correlation.loc[t1, t2]
-                        if abs(corr_value) > 0.7:
-                            high_correlation_pairs.append({
-                                "pair": f"{t1}-{t2}",
-                                "correlation": round(corr_value, 3),
-                                "interpretation": "highly positive" if corr_value > 0 else "highly negative",
-                            })
+            # Find highly correlated pairs (upper triangle, columns keep input order)
+            values = correlation.to_numpy()
+            rows, cols = np.nonzero(np.triu(np.abs(values) > 0.7, k=1))
+            names = correlation.columns.to_numpy()
+            high_correlation_pairs = [
+                {
+                    "pair": f"{t1}-{t2}",
+                    "correlation": round(float(corr_value), 3),
+                    "interpretation": "highly positive" if corr_value > 0 else "highly negative",
+                }
+                for t1, t2, corr_value in zip(names[rows], names[cols], values[rows, cols])
+            ]
             
             return {
-                "correlation_matrix": correlation.to_dict(),
+                # Row-major matrix + column labels instead of N² nested dicts
+                "correlation_matrix": {
+                    "tickers": list(correlation.columns),
+                    "matrix": np.round(values, 3).tolist(),
+                },
                 "high_correlation_pairs": high_correlation_pairs,
                 "diversification_score": _calculate_diversification_score(correlation),
                 "period_days": period_days,
@@ -161,31 +185,29 @@ class CustomTools:
             Volatility metrics including historical vol and VIX comparison
         """
         try:
-            import yfinance as yf
-            import numpy as np
-            
             end_date = datetime.now()
             start_date = end_date - timedelta(days=period_days * 2)  # Extra data for calculations
             
-            data = yf.download(ticker, start=start_date, end=end_date, progress=False)
+            data = await cached_download(ticker, start=start_date, end=end_date)
             
-            if data.empty or len(data) < period_days:
+            if ticker not in data.columns or len(data[ticker]) < period_days:
                 return {"error": f"Insufficient data for {ticker}"}
             
-            # Calculate daily returns
-            returns = data["Close"].pct_change().dropna()
+            # float32 halves the bytes the kernels stream; they accumulate in float64
+            values = data[ticker].to_numpy(dtype=np.float32)
+            close = values[~np.isnan(values)]
+            
+            # Daily return volatility, full window and last 10 days, in one pass
+            daily_vol, recent_daily_vol = vol_pass(close)
             
             # Historical volatility (annualized)
-            daily_vol = returns.std()
             annual_vol = daily_vol * np.sqrt(252)
             
             # Calculate recent vs longer-term volatility
-            recent_vol = returns.tail(10).std() * np.sqrt(252)
+            recent_vol = recent_daily_vol * np.sqrt(252)
             
-            # Max drawdown
-            rolling_max = data["Close"].cummax()
-            drawdown = (data["Close"] - rolling_max) / rolling_max
-            max_drawdown = drawdown.min()
+            # Max drawdown (running peak scan, no intermediate series)
+            max_drawdown = drawdown_pass(close)
             
             return {
                 "ticker": ticker,
@@ -215,37 +237,25 @@ class CustomTools:
         - VOLATILE: High volatility, uncertain direction
         """
         try:
-            import yfinance as yf
-            import numpy as np
-            
-            spy = yf.download(BENCHMARK, period=f"{lookback_days}d", progress=False)
+            spy = await cached_download(BENCHMARK, start=period_start(f"{lookback_days}d"))
             
-            if spy.empty or len(spy) < 20:
+            if BENCHMARK not in spy.columns or len(spy) < 20:
                 return {"error": "Insufficient data for regime detection"}
             
-            close = spy["Close"]
+            values = spy[BENCHMARK].to_numpy(dtype=np.float64)
+            values = values[~np.isnan(values)]
+            close = values.astype(np.float32)
             
-            # Calculate indicators
-            sma_20 = close.rolling(20).mean().iloc[-1]
-            sma_50 = close.rolling(50).mean().iloc[-1] if len(close) >= 50 else sma_20
-            current_price = close.iloc[-1]
+            # SMAs, 20-day SMA slope and annualized volatility in one pass
+            sma_20, sma_50, trend_slope, annual_vol = regime_pass(close)
+            volatility = annual_vol * 100
+            current_price = float(values[-1])
             
             # Price vs SMAs
             above_20 = current_price > sma_20
             above_50 = current_price > sma_50
             sma_20_above_50 = sma_20 > sma_50
             
-            # Trend strength (slope of 20-day SMA)
-            sma_20_series = close.rolling(20).mean().dropna()
-            if len(sma_20_series) >= 10:
-                trend_slope = (sma_20_series.iloc[-1] - sma_20_series.iloc[-10]) / sma_20_series.iloc[-10] * 100
-            else:
-                trend_slope = 0
-            
-            # Volatility
-            returns = close.pct_change().dropna()
-            volatility = returns.std() * np.sqrt(252) * 100  # Annualized
-            
             # Determine regime
             if volatility > 30:
                 regime = "VOLATILE"
@@ -298,39 +308,27 @@ class CustomTools:
         Args:
             period: yfinance period (1d, 5d, 1mo, 3mo, 6mo, 1y)
         """
-        # Sector ETFs
-        sectors = {
-            "XLK": "Technology",
-            "XLF": "Financials",
-            "XLV": "Healthcare",
-            "XLE": "Energy",
-            "XLY": "Consumer Discretionary",
-            "XLP": "Consumer Staples",
-            "XLI": "Industrials",
-            "XLB": "Materials",
-            "XLU": "Utilities",
-            "XLRE": "Real Estate",
-            "XLC": "Communication Services",
-        }
-        
         try:
-            import yfinance as yf
-            
-            performance = {}
-            for etf, sector in sectors.items():
-                try:
-                    data = yf.Ticker(etf).history(period=period)
-                    if not data.empty and len(data) >= 2:
-                        pct_change = ((data["Close"].iloc[-1] / data["Close"].iloc[0]) - 1) * 100
-                        performance[sector] = {
-                            "etf": etf,
-                            "change_pct": round(pct_change, 2),
-                        }
-                except Exception:
-                    continue
-            
-            # Sort by performance
-            sorted_sectors = sorted(performance.items(), key=lambda x: x[1]["change_pct"], reverse=True)
+            # One batched download for all sector ETFs
+            closes = await cached_download(list(_SECTOR_ETFS), start=period_start(period))
+            
+            sorted_sectors = []
+            if not closes.empty:
+                # Work on the raw close matrix: first/last valid close per
+                # column, ETFs with < 2 bars dropped, ranked with a stable argsort
+                values = closes.to_numpy(dtype=np.float64)
+                valid = ~np.isnan(values)
+                columns = np.arange(values.shape[1])
+                first = values[valid.argmax(axis=0), columns]
+                last = values[len(values) - 1 - valid[::-1].argmax(axis=0), columns]
+                keep = valid.sum(axis=0) >= 2
+                etfs = closes.columns.to_numpy()[keep]
+                changes = np.round((last[keep] / first[keep] - 1) * 100, 2)
+                order = np.argsort(-changes, kind="stable")
+                sorted_sectors = [
+                    (_SECTOR_ETFS[etf], {"etf": etf, "change_pct": float(change)})
+                    for etf, change in zip(etfs[order], changes[order])
+                ]
             
             return {
                 "period": period,
@@ -358,58 +356,71 @@ class CustomTools:
             period_days: Days of history to use
         """
         try:
-            import yfinance as yf
-            import numpy as np
-            
             tickers = list(portfolio.keys()) + [benchmark]
             end_date = datetime.now()
             start_date = end_date - timedelta(days=period_days * 1.5)
             
-            data = yf.download(tickers, start=start_date, end=end_date, progress=False)["Close"]
+            data = await cached_download(tickers, start=start_date, end=end_date)
             
             if data.empty:
                 return {"error": "Could not fetch data"}
             
-            returns = data.pct_change().dropna()
+            # Daily returns straight off the price matrix. Gaps are
+            # forward-filled first (as pct_change does), so equity columns
+            # align with crypto weekend rows; any row still holding a NaN
+            # (before a ticker's first close) is dropped.
+            closes = data.ffill().to_numpy(dtype=np.float64)
+            returns = np.diff(closes, axis=0) / closes[:-1]
+            returns = returns[~np.isnan(returns).any(axis=1)]
+            if len(returns) < 2:
+                return {"error": "Insufficient data for risk metrics"}
+            
+            column = {t: i for i, t in enumerate(data.columns)}
+            
+            held = [t for t in portfolio if t in column]
+            held_returns = returns[:, [column[t] for t in held]]
+            
+            # Per-holding return/volatility, computed column-parallel
+            means, stds = col_stats(held_returns)
+            holdings = {
+                ticker: {
+                    "annualized_return_pct": round(((1 + mean) ** 252 - 1) * 100, 2),
+                    "annualized_volatility_pct": round(std * np.sqrt(252) * 100, 2),
+                }
+                for ticker, mean, std in zip(held, means.tolist(), stds.tolist())
+            }
             
-            # Portfolio returns
-            portfolio_returns = pd.Series(0.0, index=returns.index)
-            for ticker, weight in portfolio.items():
-                if ticker in returns.columns:
-                    portfolio_returns += returns[ticker] * weight
+            # Portfolio returns: one matrix-vector product over the held columns
+            weights = np.array([portfolio[t] for t in held], dtype=np.float64)
+            portfolio_returns = held_returns @ weights
             
-            benchmark_returns = returns[benchmark] if benchmark in returns.columns else returns.iloc[:, 0]
+            benchmark_returns = returns[:, column.get(benchmark, 0)]
             
             # Risk metrics
             risk_free_rate = 0.05 / 252  # Approximate daily risk-free rate
             
-            # Sharpe Ratio
-            excess_returns = portfolio_returns - risk_free_rate
-            sharpe_ratio = np.sqrt(252) * excess_returns.mean() / portfolio_returns.std()
-            
-            # Sortino Ratio
-            negative_returns = portfolio_returns[portfolio_returns < 0]
-            downside_std = negative_returns.std()
-            sortino_ratio = np.sqrt(252) * excess_returns.mean() / downside_std if downside_std > 0 else 0
-            
-            # Beta
-            covariance = portfolio_returns.cov(benchmark_returns)
-            benchmark_variance = benchmark_returns.var()
-            beta = covariance / benchmark_variance if benchmark_variance > 0 else 1.0
-            
-            # Alpha (Jensen's Alpha)
-            portfolio_annual_return = (1 + portfolio_returns.mean()) ** 252 - 1
-            benchmark_annual_return = (1 + benchmark_returns.mean()) ** 252 - 1
-            alpha = portfolio_annual_return - (risk_free_rate * 252 + beta * (benchmark_annual_return - risk_free_rate * 252))
-            
-            # Maximum Drawdown
-            cumulative = (1 + portfolio_returns).cumprod()
-            rolling_max = cumulative.cummax()
-            drawdown = (cumulative - rolling_max) / rolling_max
-            max_drawdown = drawdown.min()
-            
-            # Value at Risk (95%)
-            var_95 = np.percentile(portfolio_returns, 5)
+            # Sharpe, Sortino, beta, Jensen's alpha and max drawdown in one pass
+            (
+                sharpe_ratio,
+                sortino_ratio,
+                beta,
+                alpha,
+                max_drawdown,
+                portfolio_annual_return,
+                annual_volatility,
+            ) = compute_risk(
+                portfolio_returns,
+                benchmark_returns,
+                risk_free_rate,
+            )
+            
+            # Value at Risk (95%): 5th percentile via one O(n) partition,
+            # linearly interpolated exactly as np.percentile does
+            position = 0.05 * (len(portfolio_returns) - 1)
+            lower = int(position)
+            upper = min(lower + 1, len(portfolio_returns) - 1)
+            partitioned = np.partition(portfolio_returns, (lower, upper))
+            var_95 = partitioned[lower] + (partitioned[upper] - partitioned[lower]) * (position - lower)
             
             return {
                 "portfolio": portfolio,
@@ -422,13 +433,36 @@ class CustomTools:
                     "max_drawdown_pct": round(max_drawdown * 100, 2),
                     "var_95_pct": round(var_95 * 100, 2),
                     "annualized_return_pct": round(portfolio_annual_return * 100, 2),
-                    "annualized_volatility_pct": round(portfolio_returns.std() * np.sqrt(252) * 100, 2),
+                    "annualized_volatility_pct": round(annual_volatility * 100, 2),
                 },
+                "holdings": holdings,
                 "interpretation": _interpret_risk_metrics(sharpe_ratio, beta, max_drawdown),
             }
             
         except Exception as e:
             return {"error": str(e)}
+    
+    @staticmethod
+    async def get_market_overview(portfolio: Optional[dict[str, float]] = None) -> dict[str, Any]:
+        """
+        Market regime, sector rotation and (optionally) portfolio risk in one call.
+        
+        The analyses fetch their price history concurrently, so the call takes
+        about as long as the slowest of them. Each entry carries its own result
+        or {"error": ...}.
+        
+        Args:
+            portfolio: Optional dict of ticker -> weight for risk metrics
+        """
+        analyses = {
+            "regime": CustomTools.detect_market_regime(),
+            "sectors": CustomTools.get_sector_performance(),
+        }
+        if portfolio:
+            analyses["risk"] = CustomTools.calculate_risk_metrics(portfolio)
+        
+        results = await asyncio.gather(*analyses.values())
+        return dict(zip(analyses, results))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -447,13 +481,11 @@ def _get_portfolio_recommendation(exposure: dict, risk_score: float) -> str:
 
 def _calculate_diversification_score(correlation_matrix: pd.DataFrame) -> float:
     """Calculate diversification score from correlation matrix."""
-    import numpy as np
-    
-    # Lower average correlation = better diversification
-    upper_triangle = correlation_matrix.where(
-        np.triu(np.ones(correlation_matrix.shape), k=1).astype(bool)
-    )
-    avg_correlation = upper_triangle.stack().mean()
+    # Lower average correlation = better diversification. Index the upper
+    # triangle directly; nanmean skips NaN pairs (constant or missing columns).
+    values = correlation_matrix.to_numpy() if hasattr(correlation_matrix, "to_numpy") else correlation_matrix
+    rows, cols = np.triu_indices_from(values, k=1)
+    avg_correlation = np.nanmean(values[rows, cols])
     
     # Convert to 0-100 score (lower correlation = higher score)
     score = (1 - abs(avg_correlation)) * 100
@@ -490,30 +522,32 @@ def _analyze_sector_rotation(sorted_sectors: list) -> str:
         return "MIXED - No clear rotation pattern. Monitor for emerging trends."
 
 
+# Canned interpretations indexed by bucket (see _interpret_risk_metrics)
+_SHARPE_MSGS = (
+    "Poor risk-adjusted returns - review strategy",
+    "Acceptable risk-adjusted returns",
+    "Good risk-adjusted returns (Sharpe > 1.0)",
+    "Excellent risk-adjusted returns (Sharpe > 1.5)",
+)
+_BETA_MSGS = (
+    "Low market sensitivity (beta < 0.8) - defensive positioning",
+    "Market-like sensitivity",
+    "High market sensitivity (beta > 1.2) - amplified moves",
+)
+
+
 def _interpret_risk_metrics(sharpe: float, beta: float, max_dd: float) -> str:
     """Interpret risk metrics in plain language."""
-    interpretations = []
-    
-    if sharpe > 1.5:
-        interpretations.append("Excellent risk-adjusted returns (Sharpe > 1.5)")
-    elif sharpe > 1.0:
-        interpretations.append("Good risk-adjusted returns (Sharpe > 1.0)")
-    elif sharpe > 0.5:
-        interpretations.append("Acceptable risk-adjusted returns")
-    else:
-        interpretations.append("Poor risk-adjusted returns - review strategy")
-    
-    if beta > 1.2:
-        interpretations.append("High market sensitivity (beta > 1.2) - amplified moves")
-    elif beta < 0.8:
-        interpretations.append("Low market sensitivity (beta < 0.8) - defensive positioning")
-    else:
-        interpretations.append("Market-like sensitivity")
+    # Comparisons with NaN are False, so NaN Sharpe reads as "Poor" and
+    # NaN beta as "Market-like", as with the original if/elif chains. Cast
+    # first: summing NumPy bools ORs them instead of counting.
+    sharpe, beta = float(sharpe), float(beta)
+    sharpe_msg = _SHARPE_MSGS[(sharpe > 0.5) + (sharpe > 1.0) + (sharpe > 1.5)]
+    beta_msg = _BETA_MSGS[1 + (beta > 1.2) - (beta < 0.8)]
     
     if max_dd < -0.20:
-        interpretations.append(f"Warning: Significant drawdown experienced ({max_dd*100:.1f}%)")
-    
-    return " | ".join(interpretations)
+        return f"{sharpe_msg} | {beta_msg} | Warning: Significant drawdown experienced ({max_dd*100:.1f}%)"
+    return f"{sharpe_msg} | {beta_msg}"
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -566,11 +600,32 @@ class ToolFactory:
             condition_fn: Function that returns True when alert should trigger
             message_template: Message template with {placeholders}
         """
+        # Split the template once into (literal, field) segments. Plain
+        # {name} fields are filled by lookup; templates using format specs,
+        # conversions or attribute/index access keep str.format.
+        # A malformed template is left to str.format so the error still
+        # surfaces from the handler, as before.
+        try:
+            parsed = list(string.Formatter().parse(message_template))
+        except ValueError:
+            parsed = [(None, "", "", None)]
+        segments = [(literal, field) for literal, field, _, _ in parsed]
+        simple_template = all(
+            field is None or (field.isidentifier() and not spec and not conversion)
+            for _, field, spec, conversion in parsed
+        )
+        
         async def check_alert(**kwargs) -> dict:
             try:
                 should_alert = condition_fn(**kwargs)
                 if should_alert:
-                    message = message_template.format(**kwargs)
+                    if simple_template:
+                        message = "".join(
+                            literal if field is None else literal + format(kwargs[field])
+                            for literal, field in segments
+                        )
+                    else:
+                        message = message_template.format(**kwargs)
                     return {
                         "alert": True,
                         "message": message,
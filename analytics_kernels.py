@@ -0,0 +1,226 @@
+"""
+analytics_kernels.py — Compiled numeric kernels for the agent tools
+
+Single-pass loops over NumPy arrays that replace chains of pandas operations
+in agent_tools.CustomTools. When numba is installed they are JIT-compiled
+(and cached to __pycache__); without it they run as plain Python over the
+same arrays, which is slower but gives identical results.
+
+Price kernels accept float32 closes; every element is widened to float64
+as it is read, so accumulations keep full precision either way.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange  # Optional: JIT compilation for the kernels below
+except ImportError:
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+TRADING_DAYS = 252
+
+
+@njit(cache=True)
+def compute_risk(port_rets, bench_rets, rf_daily):
+    """
+    Portfolio risk statistics in one pass over aligned daily return arrays.
+
+    Matches the pandas definitions used before (sample statistics, ddof=1):
+    Sortino uses the standard deviation of the negative returns and is 0 when
+    fewer than two returns are negative; beta falls back to 1.0 when the
+    benchmark has no variance.
+
+    Returns:
+        (sharpe, sortino, beta, alpha, max_drawdown, annual_return, annual_vol)
+    """
+    n = len(port_rets)
+    sum_p = 0.0
+    sum_p2 = 0.0
+    sum_b = 0.0
+    sum_b2 = 0.0
+    sum_pb = 0.0
+    sum_neg = 0.0
+    sum_neg2 = 0.0
+    n_neg = 0
+    cumulative = 1.0
+    peak = 0.0
+    max_dd = 0.0
+
+    for i in range(n):
+        p = port_rets[i]
+        b = bench_rets[i]
+        sum_p += p
+        sum_p2 += p * p
+        sum_b += b
+        sum_b2 += b * b
+        sum_pb += p * b
+        if p < 0.0:
+            sum_neg += p
+            sum_neg2 += p * p
+            n_neg += 1
+        cumulative *= 1.0 + p
+        if cumulative > peak:
+            peak = cumulative
+        dd = (cumulative - peak) / peak
+        if dd < max_dd:
+            max_dd = dd
+
+    mean_p = sum_p / n
+    mean_b = sum_b / n
+    var_p = (sum_p2 - n * mean_p * mean_p) / (n - 1)
+    var_b = (sum_b2 - n * mean_b * mean_b) / (n - 1)
+    cov_pb = (sum_pb - n * mean_p * mean_b) / (n - 1)
+    std_p = math.sqrt(var_p) if var_p > 0.0 else 0.0
+
+    excess_mean = mean_p - rf_daily
+    sqrt_days = math.sqrt(TRADING_DAYS)
+    sharpe = sqrt_days * excess_mean / std_p if std_p > 0.0 else math.nan
+
+    sortino = 0.0
+    if n_neg > 1:
+        mean_neg = sum_neg / n_neg
+        var_neg = (sum_neg2 - n_neg * mean_neg * mean_neg) / (n_neg - 1)
+        if var_neg > 0.0:
+            sortino = sqrt_days * excess_mean / math.sqrt(var_neg)
+
+    beta = cov_pb / var_b if var_b > 0.0 else 1.0
+
+    annual_return = (1.0 + mean_p) ** TRADING_DAYS - 1.0
+    bench_annual = (1.0 + mean_b) ** TRADING_DAYS - 1.0
+    rf_annual = rf_daily * TRADING_DAYS
+    alpha = annual_return - (rf_annual + beta * (bench_annual - rf_annual))
+
+    return sharpe, sortino, beta, alpha, max_dd, annual_return, std_p * sqrt_days
+
+
+@njit(cache=True)
+def regime_pass(close):
+    """
+    Trend/volatility inputs for market regime detection in one pass over
+    daily closes (at least 20).
+
+    Returns:
+        (sma_20, sma_50, slope_pct, annual_vol) — sma_50 falls back to sma_20
+        with fewer than 50 closes; slope_pct is the % change of the 20-day SMA
+        over its last 10 values (0 when fewer than 10 exist); annual_vol is
+        the annualized sample std of daily returns as a fraction.
+    """
+    n = len(close)
+    sum_20 = 0.0
+    sum_50 = 0.0
+    sma_20_prior = math.nan
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+
+    for i in range(n):
+        c = float(close[i])
+        sum_20 += c
+        sum_50 += c
+        if i >= 20:
+            sum_20 -= float(close[i - 20])
+        if i >= 50:
+            sum_50 -= float(close[i - 50])
+        if i == n - 10 and i >= 19:
+            sma_20_prior = sum_20 / 20.0
+        if i > 0:
+            # Welford update over daily returns
+            r = c / float(close[i - 1]) - 1.0
+            count += 1
+            delta = r - mean
+            mean += delta / count
+            m2 += delta * (r - mean)
+
+    sma_20 = sum_20 / 20.0
+    sma_50 = sum_50 / 50.0 if n >= 50 else sma_20
+    slope_pct = 0.0
+    if not math.isnan(sma_20_prior):
+        slope_pct = (sma_20 - sma_20_prior) / sma_20_prior * 100.0
+    annual_vol = math.sqrt(m2 / (count - 1) * TRADING_DAYS) if count > 1 else math.nan
+    return sma_20, sma_50, slope_pct, annual_vol
+
+
+@njit(cache=True)
+def vol_pass(close):
+    """
+    Daily return volatility over the whole series and over its last 10
+    returns, in one pass over daily closes.
+
+    Returns:
+        (daily_std, recent_daily_std) — sample stds (ddof=1), not annualized;
+        NaN when fewer than two returns are available.
+    """
+    n = len(close)
+    recent_start = max(1, n - 10)
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    recent_count = 0
+    recent_mean = 0.0
+    recent_m2 = 0.0
+
+    for i in range(1, n):
+        r = float(close[i]) / float(close[i - 1]) - 1.0
+        count += 1
+        delta = r - mean
+        mean += delta / count
+        m2 += delta * (r - mean)
+        if i >= recent_start:
+            recent_count += 1
+            delta = r - recent_mean
+            recent_mean += delta / recent_count
+            recent_m2 += delta * (r - recent_mean)
+
+    daily_std = math.sqrt(m2 / (count - 1)) if count > 1 else math.nan
+    recent_std = math.sqrt(recent_m2 / (recent_count - 1)) if recent_count > 1 else math.nan
+    return daily_std, recent_std
+
+
+@njit(cache=True)
+def drawdown_pass(close):
+    """Largest peak-to-trough decline of a price series, as a fraction (<= 0)."""
+    peak = float(close[0])
+    worst = 0.0
+    for i in range(len(close)):
+        c = float(close[i])
+        if c > peak:
+            peak = c
+        dd = (c - peak) / peak
+        if dd < worst:
+            worst = dd
+    return worst
+
+
+@njit(parallel=True, cache=True)
+def col_stats(mat):
+    """
+    Per-column mean and sample std (ddof=1) of a 2-D returns matrix, one
+    column per thread when compiled with numba.
+
+    Returns:
+        (means, stds) — float64 arrays of length mat.shape[1]; std is NaN for
+        columns with fewer than two rows.
+    """
+    n, k = mat.shape
+    means = np.empty(k)
+    stds = np.empty(k)
+    for j in prange(k):
+        mean = 0.0
+        m2 = 0.0
+        for i in range(n):
+            x = float(mat[i, j])
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+        means[j] = mean if n > 0 else math.nan
+        stds[j] = math.sqrt(m2 / (n - 1)) if n > 1 else math.nan
+    return means, stds
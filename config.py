@@ -4,6 +4,7 @@ All thresholds, tickers, and scheduling parameters live here.
 """
 
 import os
+import re
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -20,6 +21,11 @@ DEFENSIVE_INCOME = ["JEPI", "JEPQ"]
 CRYPTO_CANARIES = ["BTC-USD", "ETH-USD"]
 BENCHMARK = "SPY"
 
+# Frozen views of the ticker lists for O(1) membership tests
+CORE_PORTFOLIO_SET = frozenset(CORE_PORTFOLIO)
+DEFENSIVE_INCOME_SET = frozenset(DEFENSIVE_INCOME)
+CRYPTO_CANARIES_SET = frozenset(CRYPTO_CANARIES)
+
 # ─── Portfolio Meme Tokens (Monitored every 5 minutes) ───────────────────────
 # Format: {"name": str, "symbol": str, "address": str, "chain": str}
 PORTFOLIO_TOKENS = [
@@ -61,6 +67,13 @@ NEGATIVE_KEYWORDS = [
     "downturn", "panic", "correction", "default",
     "bankruptcy", "crisis", "contagion", "meltdown",
 ]
+# All keywords in one pattern. The zero-width lookahead reports every keyword
+# occurrence, including ones nested in a longer phrase ("crisis" inside
+# "liquidity crisis"), so len(findall()) equals summing str.count() per keyword.
+NEGATIVE_KEYWORDS_RE = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in NEGATIVE_KEYWORDS) + "))",
+    re.IGNORECASE,
+)
 # Threshold: if >= this many negative keyword hits in latest news batch → WARNING
 NEWS_NEGATIVE_THRESHOLD: int = 5
 
@@ -70,6 +83,10 @@ FMP_NEWS_ENDPOINT = f"{FMP_BASE_URL}/stock_news"
 FMP_ECONOMIC_CALENDAR_ENDPOINT = f"{FMP_BASE_URL}/economic_calendar"
 FMP_NEWS_LIMIT: int = 50
 
+# ─── API Rate Limits (proactive client-side throttling) ─────────────────────
+POLYGON_RATE_LIMIT_PER_SEC: float = float(os.getenv("POLYGON_RATE_LIMIT_PER_SEC", "5"))
+FMP_RATE_LIMIT_PER_MIN: float = float(os.getenv("FMP_RATE_LIMIT_PER_MIN", "10"))
+
 # ─── Alert Rate Limiting ────────────────────────────────────────────────────
 ALERT_COOLDOWN_CRITICAL_HOURS: int = int(os.getenv("ALERT_COOLDOWN_HOURS", "4"))
 ALERT_COOLDOWN_WARNING_HOURS: int = 2
@@ -85,10 +102,17 @@ MARKET_OPEN_HOUR: int = 9
 MARKET_OPEN_MINUTE: int = 30
 MARKET_CLOSE_HOUR: int = 16
 MARKET_CLOSE_MINUTE: int = 0
+SCHEDULER_MAX_WORKERS: int = int(os.getenv("SCHEDULER_MAX_WORKERS", "4"))  # concurrent job threads
 
 # ─── State File ──────────────────────────────────────────────────────────────
 STATE_FILE_PATH: str = os.getenv("STATE_FILE_PATH", "monitor_state.json")
 
+# ─── Response Caches ─────────────────────────────────────────────────────────
+# The 90-day economic calendar window only moves once a day; reuse the last
+# response for a few hours instead of spending FMP quota every macro tick.
+FMP_CALENDAR_CACHE_PATH: str = os.getenv("FMP_CALENDAR_CACHE_PATH", ".cache/fmp_economic_calendar.json")
+FMP_CALENDAR_CACHE_TTL_HOURS: float = float(os.getenv("FMP_CALENDAR_CACHE_TTL_HOURS", "6"))
+
 # ─── Logging ─────────────────────────────────────────────────────────────────
 LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 LOG_FORMAT: str = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
@@ -48,7 +48,8 @@ for i, pair in enumerate(pairs[:5]):
 print("\n=== Step 4: Full scan ===", flush=True)
 # Clear seen tokens for fresh scan
 _seen_tokens.clear()
-signals = scan_new_tokens(["solana"])
+# Scan the pairs from step 2 rather than fetching them again
+signals = scan_new_tokens(["solana"], pairs_by_chain={"solana": pairs})
 print(f"Signals generated: {len(signals)}", flush=True)
 
 for sig in signals[:5]:
@@ -6,39 +6,262 @@ Implements:
   - Federal Reserve interest rate decision tracking (pivot detection)
 """
 
+import itertools
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import Optional
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import hyperscan  # Optional: SIMD multi-keyword news scanning (x86-64 only)
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick  # Optional: linear-time multi-keyword news scanning
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # Optional: faster JSON parsing of FMP responses
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: stream-parse the news array article by article
+except ImportError:
+    ijson = None
 
 from config import (
     FMP_API_KEY,
     FMP_NEWS_ENDPOINT,
     FMP_ECONOMIC_CALENDAR_ENDPOINT,
+    FMP_CALENDAR_CACHE_PATH,
+    FMP_CALENDAR_CACHE_TTL_HOURS,
     FMP_NEWS_LIMIT,
+    FMP_RATE_LIMIT_PER_MIN,
     NEGATIVE_KEYWORDS,
+    NEGATIVE_KEYWORDS_RE,
     NEWS_NEGATIVE_THRESHOLD,
 )
 
 logger = logging.getLogger(__name__)
 
 
+class RateLimiter:
+    """
+    Thread-safe token bucket: allows bursts up to `capacity`, refills at
+    `rate` tokens/second. Use as a context manager around each request.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def __enter__(self) -> "RateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+# Process-wide FMP budget: every FMP request, here or in the agent
+# orchestrator, takes a token from this one bucket
+FMP_BUCKET = RateLimiter(rate=FMP_RATE_LIMIT_PER_MIN / 60, capacity=FMP_RATE_LIMIT_PER_MIN)
+
+
+class _FmpRetry(Retry):
+    """Retry policy that takes an FMP token before re-issuing a request."""
+
+    def sleep(self, response=None) -> None:
+        super().sleep(response)
+        FMP_BUCKET.acquire()
+
+
+# One keep-alive session for all FMP calls: consecutive (and concurrent) jobs
+# reuse the TLS connection, and transient 429/5xx responses are retried with
+# backoff before surfacing as a RequestException. The concurrent news and
+# calendar requests can each hold a pooled connection (pool_maxsize), and the
+# calendar is served from the file cache on most ticks, so an HTTP/2 client
+# would rarely have a second request to multiplex.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=_FmpRetry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+        ),
+    ),
+)
+
+
 class MacroSignal:
     """Represents a macro-level signal from news or economic data."""
 
+    __slots__ = ("name", "level", "message", "value", "_as_dict")
+
     def __init__(self, name: str, level: str, message: str, value: Optional[float] = None):
         self.name = name
         self.level = level
         self.message = message
         self.value = value
+        self._as_dict: Optional[dict] = None
+
+    @property
+    def as_dict(self) -> dict:
+        """Serializable form of the signal, built once on first access."""
+        if self._as_dict is None:
+            self._as_dict = {
+                "name": self.name,
+                "level": self.level,
+                "message": self.message,
+                "value": self.value,
+            }
+        return self._as_dict
 
     def __repr__(self) -> str:
         return f"MacroSignal({self.level}: {self.name} — {self.message})"
 
 
+def _response_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, straight from bytes when orjson is available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 # ─── News Sentiment ──────────────────────────────────────────────────────────
 
+_ALERT_HEADLINES = 5  # headlines quoted in a negative-news alert
+
+# Hyperscan database / Aho-Corasick automaton over the lowercased keywords,
+# built on first use and reused by every later scan. Both report every
+# occurrence (including "crisis" inside "liquidity crisis"), the same hits
+# NEGATIVE_KEYWORDS_RE finds when neither library is installed.
+_NEG_KEYWORDS_LOWER = [k.lower() for k in NEGATIVE_KEYWORDS]
+_NEG_HS_DB = None
+_NEG_HS_LOCK = threading.Lock()  # a Hyperscan database shares one scratch space
+_NEG_AUTOMATON = None
+
+
+def _get_neg_hs_db():
+    """Return the shared Hyperscan keyword database, or None without hyperscan."""
+    global _NEG_HS_DB
+    if _NEG_HS_DB is None and hyperscan is not None:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[re.escape(k).encode() for k in _NEG_KEYWORDS_LOWER],
+            ids=list(range(len(_NEG_KEYWORDS_LOWER))),
+            elements=len(_NEG_KEYWORDS_LOWER),
+            flags=[0] * len(_NEG_KEYWORDS_LOWER),
+        )
+        _NEG_HS_DB = db
+    return _NEG_HS_DB
+
+
+def _get_neg_automaton():
+    """Return the shared keyword automaton, or None without pyahocorasick."""
+    global _NEG_AUTOMATON
+    if _NEG_AUTOMATON is None and ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in NEGATIVE_KEYWORDS:
+            automaton.add_word(keyword.lower(), keyword.lower())
+        automaton.make_automaton()
+        _NEG_AUTOMATON = automaton
+    return _NEG_AUTOMATON
+
+
+def _negative_keyword_hits(text: str) -> list[str]:
+    """Every negative keyword occurrence in lowercased `text`, in order."""
+    db = _get_neg_hs_db()
+    if db is not None:
+        hits: list[str] = []
+
+        def on_match(kw_id, start, end, flags, context):
+            hits.append(_NEG_KEYWORDS_LOWER[kw_id])
+
+        with _NEG_HS_LOCK:
+            db.scan(text.encode(), match_event_handler=on_match)
+        return hits
+    automaton = _get_neg_automaton()
+    if automaton is not None:
+        return [keyword for _, keyword in automaton.iter(text)]
+    return NEGATIVE_KEYWORDS_RE.findall(text)
+
+
+def _scan_articles(articles: Iterable[dict]) -> tuple[int, int, list[str], list[str], bool]:
+    """
+    Count negative keyword hits across article titles and texts.
+
+    Kept free of I/O and fully annotated so it can be compiled on its own
+    (mypyc) if the scan ever shows up in a profile.
+
+    Returns:
+        (negative_hits, articles_scanned, matched_keywords, negative_headlines,
+        complete) — complete is False when the scan stopped early, in which
+        case the hits and keywords are lower bounds
+    """
+    negative_hits: int = 0
+    articles_scanned: int = 0
+    matched: dict[str, None] = {}  # insertion-ordered set of keywords
+    negative_headlines: list[str] = []
+    seen_titles: set[str] = set()  # lowercased titles already in negative_headlines
+
+    for article in articles:
+        articles_scanned += 1
+        # Scan title and body separately: no combined copy, and no phantom
+        # matches spanning the end of the title and start of the body
+        title: str = article.get("title", "").lower()
+        hits: list[str] = _negative_keyword_hits(title)
+        hits.extend(_negative_keyword_hits(article.get("text", "").lower()))
+        if hits:
+            negative_hits += len(hits)
+            matched.update(dict.fromkeys(hits))
+            if title and title not in seen_titles:
+                seen_titles.add(title)
+                negative_headlines.append(article.get("title", "N/A"))
+            # Enough evidence for the alert and its headline list;
+            # the remaining articles can't change the outcome
+            if (
+                negative_hits >= NEWS_NEGATIVE_THRESHOLD
+                and len(negative_headlines) >= _ALERT_HEADLINES
+            ):
+                return negative_hits, articles_scanned, list(matched), negative_headlines, False
+
+    return negative_hits, articles_scanned, list(matched), negative_headlines, True
+
+
 def fetch_news_sentiment() -> tuple[Optional[MacroSignal], dict]:
     """
     Fetch latest stock market news from FMP and perform keyword-based
@@ -56,54 +279,57 @@ def fetch_news_sentiment() -> tuple[Optional[MacroSignal], dict]:
     try:
         url = f"{FMP_NEWS_ENDPOINT}?limit={FMP_NEWS_LIMIT}&apikey={FMP_API_KEY}"
         logger.info("Fetching news from FMP...")
-        response = requests.get(url, timeout=15)
-        response.raise_for_status()
-        articles = response.json()
-
-        if not isinstance(articles, list):
-            logger.warning(f"Unexpected FMP news response format: {type(articles)}")
-            return None, {}
-
-        # Count negative keyword hits across all article titles and texts
-        negative_hits = 0
-        matched_keywords: list[str] = []
-        negative_headlines: list[str] = []
-
-        for article in articles:
-            title = article.get("title", "").lower()
-            text = article.get("text", "").lower()
-            combined = f"{title} {text}"
-
-            for keyword in NEGATIVE_KEYWORDS:
-                count = combined.count(keyword.lower())
-                if count > 0:
-                    negative_hits += count
-                    if keyword not in matched_keywords:
-                        matched_keywords.append(keyword)
-                    if title and title not in [h.lower() for h in negative_headlines]:
-                        negative_headlines.append(article.get("title", "N/A"))
+        with FMP_BUCKET:
+            response = _SESSION.get(url, timeout=15, stream=ijson is not None)
+
+        with response:
+            response.raise_for_status()
+            if ijson is not None:
+                # Scan each article as it is parsed off the socket and drop it;
+                # the full array is never held in memory
+                response.raw.decode_content = True
+                events = ijson.parse(response.raw)
+                first = next(events, None)
+                # FMP reports errors as a JSON object; only an array holds articles
+                if first is None or first[1] != "start_array":
+                    kind = first[1] if first is not None else "empty body"
+                    logger.warning(f"Unexpected FMP news response format: {kind}")
+                    return None, {}
+                articles = ijson.items(itertools.chain([first], events), "item")
+            else:
+                articles = _response_json(response)
+                if not isinstance(articles, list):
+                    logger.warning(f"Unexpected FMP news response format: {type(articles)}")
+                    return None, {}
+
+            negative_hits, articles_scanned, matched_keywords, negative_headlines, complete = (
+                _scan_articles(articles)
+            )
 
         state_update = {
             "news_negative_hits": negative_hits,
             "news_matched_keywords": matched_keywords[:10],  # cap for state size
-            "news_articles_scanned": len(articles),
+            "news_articles_scanned": articles_scanned,
+            "news_scan_complete": complete,  # False: hits are a lower bound
             "news_last_check": datetime.utcnow().isoformat(),
         }
 
+        # The scan stops once the alert is certain, so the count may be partial
+        hits_text = str(negative_hits) if complete else f"at least {negative_hits}"
         logger.info(
-            f"News sentiment: {negative_hits} negative hits across "
-            f"{len(articles)} articles (keywords: {matched_keywords})"
+            f"News sentiment: {hits_text} negative hits across "
+            f"{articles_scanned} articles (keywords: {matched_keywords})"
         )
 
         if negative_hits >= NEWS_NEGATIVE_THRESHOLD:
-            top_headlines = "\n".join(f"  • {h}" for h in negative_headlines[:5])
+            top_headlines = "\n".join(f"  • {h}" for h in negative_headlines[:_ALERT_HEADLINES])
             return MacroSignal(
                 name="NEWS_SENTIMENT_NEGATIVE",
                 level="WARNING",
                 message=(
                     f"⚠️ NEGATIVE NEWS SPIKE DETECTED\n"
-                    f"Found {negative_hits} negative keyword matches "
-                    f"in {len(articles)} articles\n"
+                    f"Found {hits_text} negative keyword matches "
+                    f"in {articles_scanned} articles\n"
                     f"Keywords: {', '.join(matched_keywords[:5])}\n"
                     f"Top headlines:\n{top_headlines}"
                 ),
@@ -113,7 +339,7 @@ def fetch_news_sentiment() -> tuple[Optional[MacroSignal], dict]:
         return MacroSignal(
             name="NEWS_STATUS",
             level="INFO",
-            message=f"News: {negative_hits} neg hits / {len(articles)} articles scanned",
+            message=f"News: {hits_text} neg hits / {articles_scanned} articles scanned",
             value=float(negative_hits),
         ), state_update
 
@@ -127,6 +353,55 @@ def fetch_news_sentiment() -> tuple[Optional[MacroSignal], dict]:
 
 # ─── Federal Reserve Rate Decision ──────────────────────────────────────────
 
+# Calendar events that report a Fed rate decision
+_FED_EVENT_RE = re.compile(
+    r"federal funds rate|interest rate decision|fed interest rate", re.IGNORECASE
+)
+
+# (date_to, cache_key, url) for the current UTC day's 90-day calendar window
+_FED_WINDOW: Optional[tuple[str, str, str]] = None
+
+
+def _fed_calendar_window(today: str) -> tuple[str, str]:
+    """Return (cache_key, url) for the window ending `today`, rebuilt once per day."""
+    global _FED_WINDOW
+    if _FED_WINDOW is None or _FED_WINDOW[0] != today:
+        # Look back 90 days for recent Fed decisions
+        date_from = (date.fromisoformat(today) - timedelta(days=90)).isoformat()
+        url = (
+            f"{FMP_ECONOMIC_CALENDAR_ENDPOINT}"
+            f"?from={date_from}&to={today}&apikey={FMP_API_KEY}"
+        )
+        _FED_WINDOW = (today, f"{date_from}|{today}", url)
+    return _FED_WINDOW[1], _FED_WINDOW[2]
+
+
+def _load_calendar_cache(cache_key: str) -> Optional[list]:
+    """Return cached calendar events for `cache_key` if fresh, else None."""
+    try:
+        with open(FMP_CALENDAR_CACHE_PATH, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("key") != cache_key:
+        return None
+    if time.time() - cached.get("fetched_at", 0) > FMP_CALENDAR_CACHE_TTL_HOURS * 3600:
+        return None
+    return cached.get("events")
+
+
+def _save_calendar_cache(cache_key: str, events: list) -> None:
+    """Persist the latest calendar response (only one window is ever kept)."""
+    try:
+        os.makedirs(os.path.dirname(FMP_CALENDAR_CACHE_PATH) or ".", exist_ok=True)
+        tmp_path = f"{FMP_CALENDAR_CACHE_PATH}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"key": cache_key, "fetched_at": time.time(), "events": events}, f)
+        os.replace(tmp_path, FMP_CALENDAR_CACHE_PATH)
+    except OSError as e:
+        logger.warning(f"Could not write economic calendar cache: {e}")
+
+
 def fetch_fed_rate(previous_state: dict) -> tuple[Optional[MacroSignal], dict]:
     """
     Fetch recent Federal Reserve interest rate decisions from FMP
@@ -145,40 +420,38 @@ def fetch_fed_rate(previous_state: dict) -> tuple[Optional[MacroSignal], dict]:
         return None, {}
 
     try:
-        # Look back 90 days for recent Fed decisions
-        date_to = datetime.utcnow().strftime("%Y-%m-%d")
-        date_from = (datetime.utcnow() - timedelta(days=90)).strftime("%Y-%m-%d")
-
-        url = (
-            f"{FMP_ECONOMIC_CALENDAR_ENDPOINT}"
-            f"?from={date_from}&to={date_to}&apikey={FMP_API_KEY}"
-        )
-
-        logger.info("Fetching economic calendar from FMP...")
-        response = requests.get(url, timeout=15)
-        response.raise_for_status()
-        events = response.json()
+        # One clock read per check: the window and fed_last_check agree even
+        # if the check straddles midnight UTC
+        now = datetime.utcnow()
+        # Window and cache key are whole UTC days, so every tick within a day
+        # reuses the same URL and cache entry
+        cache_key, url = _fed_calendar_window(now.strftime("%Y-%m-%d"))
+        events = _load_calendar_cache(cache_key)
+
+        if events is not None:
+            logger.info("Using cached economic calendar")
+        else:
+            logger.info("Fetching economic calendar from FMP...")
+            with FMP_BUCKET:
+                response = _SESSION.get(url, timeout=15)
+            response.raise_for_status()
+            events = _response_json(response)
+            if isinstance(events, list):
+                _save_calendar_cache(cache_key, events)
 
         if not isinstance(events, list):
             logger.warning(f"Unexpected FMP calendar response: {type(events)}")
             return None, {}
 
         # Filter for Federal Funds Rate / Fed Interest Rate events
-        fed_events = [
-            e for e in events
-            if any(
-                kw in (e.get("event", "") or "").lower()
-                for kw in ["federal funds rate", "interest rate decision", "fed interest rate"]
-            )
-        ]
+        fed_events = [e for e in events if _FED_EVENT_RE.search(e.get("event") or "")]
 
         if not fed_events:
             logger.info("No Fed rate events found in the last 90 days")
-            return None, {"fed_last_check": datetime.utcnow().isoformat()}
+            return None, {"fed_last_check": now.isoformat()}
 
-        # Sort by date descending, take the most recent
-        fed_events.sort(key=lambda x: x.get("date", ""), reverse=True)
-        latest = fed_events[0]
+        # Most recent event (first one wins on equal dates, as the stable sort did)
+        latest = max(fed_events, key=lambda x: x.get("date") or "")
 
         current_rate = latest.get("actual")
         previous_rate = latest.get("previous")
@@ -188,7 +461,7 @@ def fetch_fed_rate(previous_state: dict) -> tuple[Optional[MacroSignal], dict]:
             "fed_rate_current": current_rate,
             "fed_rate_previous": previous_rate,
             "fed_rate_date": event_date,
-            "fed_last_check": datetime.utcnow().isoformat(),
+            "fed_last_check": now.isoformat(),
         }
 
         logger.info(
@@ -260,14 +533,19 @@ def check_macro_environment(previous_state: dict) -> tuple[list, dict]:
     signals: list = []
     combined_state: dict = {}
 
+    # The two FMP requests are independent — run them side by side
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="macro") as pool:
+        news_future = pool.submit(fetch_news_sentiment)
+        fed_future = pool.submit(fetch_fed_rate, previous_state)
+        news_signal, news_state = news_future.result()
+        fed_signal, fed_state = fed_future.result()
+
     # 1. News Sentiment
-    news_signal, news_state = fetch_news_sentiment()
     if news_signal:
         signals.append(news_signal)
     combined_state.update(news_state)
 
     # 2. Fed Rate
-    fed_signal, fed_state = fetch_fed_rate(previous_state)
     if fed_signal:
         signals.append(fed_signal)
     combined_state.update(fed_state)
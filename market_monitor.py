@@ -16,10 +16,14 @@ Alerts are sent via Telegram when state changes are detected.
 import logging
 import signal
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
+from apscheduler.executors.pool import ThreadPoolExecutor as JobExecutor
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
@@ -30,6 +34,7 @@ from config import (
     MARKET_CHECK_INTERVAL_MIN,
     CRYPTO_CHECK_INTERVAL_MIN,
     NEWS_CHECK_INTERVAL_MIN,
+    SCHEDULER_MAX_WORKERS,
     DAILY_SUMMARY_HOUR,
     DAILY_SUMMARY_MINUTE,
     ALL_TICKERS,
@@ -45,7 +50,7 @@ from technical_analysis import (
 )
 from macro_analysis import check_macro_environment
 from notifications import send_alert, send_daily_summary
-from state_manager import load_state, save_state, update_state, get_state_summary
+from state_manager import load_state, update_state, commit_delta, get_state_summary
 from meme_scanner import job_meme_scan, job_trending_scan, job_portfolio_tokens
 
 # ─── Logging Setup ───────────────────────────────────────────────────────────
@@ -59,7 +64,11 @@ logging.getLogger("urllib3").setLevel(logging.WARNING)
 logging.getLogger("apscheduler").setLevel(logging.WARNING)
 
 # ─── Accumulated INFO signals for daily summary ─────────────────────────────
-_daily_info_signals: list = []
+# Bounded so a missed 5 PM reset can't grow it without limit
+DAILY_INFO_SIGNALS_MAX = 500
+_daily_info_signals: deque = deque(maxlen=DAILY_INFO_SIGNALS_MAX)
+# Jobs append from scheduler threads while the summary drains it
+_daily_info_lock = threading.Lock()
 
 
 # ─── Job: Market Health Check (equities) ────────────────────────────────────
@@ -88,7 +97,7 @@ def job_market_health() -> None:
             _handle_signal(stop_signal)
 
         # Save updated state
-        save_state(state)
+        state = commit_delta({**sma_state, **stop_state})
         logger.info(get_state_summary(state))
 
     except Exception as e:
@@ -107,12 +116,11 @@ def job_crypto_canary() -> None:
         state = load_state()
 
         crypto_signal, crypto_state = analyze_crypto_canary(state)
-        state = update_state(state, crypto_state)
 
         if crypto_signal:
             _handle_signal(crypto_signal)
 
-        save_state(state)
+        commit_delta(crypto_state)
 
     except Exception as e:
         logger.error(f"Crypto canary check failed: {e}", exc_info=True)
@@ -130,12 +138,11 @@ def job_macro_sentiment() -> None:
         state = load_state()
 
         signals, macro_state = check_macro_environment(state)
-        state = update_state(state, macro_state)
 
         for sig in signals:
             _handle_signal(sig)
 
-        save_state(state)
+        commit_delta(macro_state)
 
     except Exception as e:
         logger.error(f"Macro sentiment check failed: {e}", exc_info=True)
@@ -148,27 +155,33 @@ def job_daily_summary() -> None:
     Scheduled job: Send a daily summary at 5 PM ET.
     Includes all current prices, state, and accumulated INFO signals.
     """
-    global _daily_info_signals
     logger.info("═══ Sending Daily Summary ═══")
 
     try:
-        state = load_state()
-
         # Fetch latest prices for all tickers
         prices = fetch_all_prices(ALL_TICKERS)
-        for ticker, price in prices.items():
-            if price is not None:
-                state[f"price_{ticker}"] = price
-
-        save_state(state)
+        state = commit_delta({
+            f"price_{ticker}": price
+            for ticker, price in prices.items()
+            if price is not None
+        })
+
+        # Take the day's signals and reset the accumulator in one step, so a
+        # signal raised while the summary is being sent lands in tomorrow's
+        with _daily_info_lock:
+            info_signals = list(_daily_info_signals)
+            _daily_info_signals.clear()
 
         # Send the summary
-        results = send_daily_summary(state, _daily_info_signals)
+        try:
+            results = send_daily_summary(state, info_signals)
+        except Exception:
+            # Put them back ahead of anything raised since, for the next summary
+            with _daily_info_lock:
+                _daily_info_signals.extendleft(reversed(info_signals))
+            raise
         logger.info(f"Daily summary sent: {results}")
 
-        # Reset daily accumulator
-        _daily_info_signals = []
-
     except Exception as e:
         logger.error(f"Daily summary failed: {e}", exc_info=True)
 
@@ -180,8 +193,6 @@ def _handle_signal(signal_obj) -> None:
     Process a signal: dispatch alerts for WARNING/CRITICAL/GREEN,
     accumulate INFO signals for daily summary.
     """
-    global _daily_info_signals
-
     level = signal_obj.level
     name = signal_obj.name
     message = signal_obj.message
@@ -200,7 +211,8 @@ def _handle_signal(signal_obj) -> None:
 
     elif level == "INFO":
         # Accumulate for daily summary
-        _daily_info_signals.append(signal_obj)
+        with _daily_info_lock:
+            _daily_info_signals.append(signal_obj)
 
 
 # ─── Startup Validation ─────────────────────────────────────────────────────
@@ -256,8 +268,7 @@ def send_startup_notification() -> None:
             pass  # corrupted value, send anyway
 
     # ── Record this startup ──
-    state["_last_startup"] = now_et.isoformat()
-    save_state(state)
+    commit_delta({"_last_startup": now_et.isoformat()})
 
     now = now_et.strftime("%Y-%m-%d %I:%M %p %Z")
     body = (
@@ -319,20 +330,33 @@ def main() -> None:
     # Send startup notification
     send_startup_notification()
 
-    # Run an initial check immediately
+    # Run an initial check immediately. The jobs touch disjoint state keys and
+    # commit through commit_delta(), so they can all run at once.
     logger.info("Running initial checks...")
     try:
-        job_market_health()
-        job_crypto_canary()
-        job_macro_sentiment()
-        job_meme_scan()  # Initial meme coin scan
-        job_portfolio_tokens()  # Initial portfolio token check (AUKI, USOR)
+        initial_jobs = (
+            job_market_health,
+            job_crypto_canary,
+            job_macro_sentiment,
+            job_portfolio_tokens,  # Initial portfolio token check (AUKI, USOR)
+            job_meme_scan,         # Initial meme coin scan
+        )
+        with ThreadPoolExecutor(max_workers=len(initial_jobs), thread_name_prefix="initial") as pool:
+            for future in [pool.submit(job) for job in initial_jobs]:
+                future.result()
     except Exception as e:
         logger.error(f"Initial check failed (non-fatal): {e}")
 
     # ─── Set Up Scheduler ────────────────────────────────────────────────
 
-    scheduler = BlockingScheduler(timezone="US/Eastern")
+    # Jobs run on a worker pool so a slow yfinance/FMP call in one job does not
+    # delay the others past their misfire grace. coalesce folds a backlog of
+    # missed runs into one; max_instances=1 keeps a job from overlapping itself.
+    scheduler = BlockingScheduler(
+        timezone="US/Eastern",
+        executors={"default": JobExecutor(max_workers=SCHEDULER_MAX_WORKERS)},
+        job_defaults={"coalesce": True, "max_instances": 1},
+    )
 
     # Market health: every 15 min, Mon-Fri during market hours (9:30 AM - 4:00 PM ET)
     scheduler.add_job(
@@ -12,12 +12,17 @@ Features:
 - Configurable alerts via Telegram
 """
 
+import asyncio
 import logging
 import os
+import random
 import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
+from urllib.parse import urlsplit
 import requests
 
 from notifications import send_alert
@@ -40,6 +45,18 @@ CHAIN_IDS = {
     "arbitrum": "42161",
 }
 
+# GeckoTerminal network IDs (new_pools / trending_pools)
+_GECKO_NEW_POOL_NETWORKS = {
+    "solana": "solana",
+    "ethereum": "eth",
+    "base": "base",
+    "bsc": "bsc",
+}
+_GECKO_TRENDING_NETWORKS = {**_GECKO_NEW_POOL_NETWORKS, "arbitrum": "arbitrum"}
+
+# Addresses per GoPlus token_security request (EVM chains)
+GOPLUS_BATCH_SIZE = 30
+
 # Minimum liquidity to consider for alerts (in USD)
 # Set to $10K to filter out low-liquidity/high-risk tokens
 MIN_LIQUIDITY_USD = 10000
@@ -83,9 +100,119 @@ class MemeSignal:
 
 # ─── Tracked Tokens State ────────────────────────────────────────────────────
 
-_seen_tokens: set = set()  # Track already seen tokens to avoid duplicate alerts
+# Placeholder symbols/names that mark a pair as unusable
+_INVALID_SYMBOLS = frozenset({"???", "UNKNOWN", ""})
+_INVALID_NAMES = frozenset({"Unknown", "UNKNOWN", ""})
+
+SEEN_TOKENS_MAX = 50_000  # ~a few MB of keys; oldest are forgotten beyond this
+
+
+class SeenTokens:
+    """
+    Bounded set of token keys, evicting the least recently seen.
+
+    A membership hit refreshes the key, so a token that keeps showing up in
+    new-pool listings stays remembered while it is listed; tokens that
+    dropped off long ago are the ones forgotten.
+    """
+
+    def __init__(self, maxsize: int = SEEN_TOKENS_MAX):
+        self.maxsize = maxsize
+        self._keys: OrderedDict[str, None] = OrderedDict()
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return True
+        return False
+
+    def add(self, key: str) -> None:
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        if len(self._keys) > self.maxsize:
+            self._keys.popitem(last=False)
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+_seen_tokens = SeenTokens()  # Track already seen tokens to avoid duplicate alerts
 _watchlist: dict = {}  # Tokens we're watching
 
+# ─── Async HTTP Session ──────────────────────────────────────────────────────
+
+def _new_session():
+    """
+    One pooled aiohttp session per scan: DNS lookups are cached and many
+    requests per host can be in flight at once.
+    """
+    import aiohttp
+
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=256, limit_per_host=64, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=10),
+    )
+
+
+async def _with_session(scan, *args):
+    """Run `scan(session, *args)` in a fresh session (used by the sync entry points)."""
+    async with _new_session() as session:
+        return await scan(session, *args)
+
+
+# Max concurrent requests per API host; GoPlus is the first to 429
+HOST_CONCURRENCY = {
+    "api.gopluslabs.io": 4,
+    "api.geckoterminal.com": 8,
+    "api.dexscreener.com": 8,
+}
+DEFAULT_HOST_CONCURRENCY = 8
+FETCH_MAX_RETRIES = 4        # retries after a 429/5xx before giving up
+FETCH_MAX_BACKOFF_S = 30.0
+
+# Per-event-loop host semaphores: each job runs its own loop via asyncio.run()
+_host_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()  # loop -> {host: Semaphore}
+
+
+def _host_semaphore(host: str) -> asyncio.Semaphore:
+    """Concurrency gate for `host` on the running event loop."""
+    semaphores = _host_semaphores.setdefault(asyncio.get_running_loop(), {})
+    if host not in semaphores:
+        semaphores[host] = asyncio.Semaphore(HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY))
+    return semaphores[host]
+
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """Honor a numeric Retry-After header, else exponential backoff with jitter."""
+    try:
+        return min(FETCH_MAX_BACKOFF_S, max(0.0, float(retry_after)))
+    except (TypeError, ValueError):
+        return min(FETCH_MAX_BACKOFF_S, 2 ** attempt + random.random())
+
+
+async def fetch_json(session, url: str):
+    """
+    GET `url` over the shared session and decode the JSON body.
+
+    Requests are capped per host (HOST_CONCURRENCY). 429 and 5xx responses
+    are retried up to FETCH_MAX_RETRIES times with backoff, sleeping outside
+    the host gate so other requests keep flowing; the final failure raises.
+    """
+    host = urlsplit(url).hostname or ""
+    for attempt in range(FETCH_MAX_RETRIES + 1):
+        async with _host_semaphore(host):
+            async with session.get(url) as resp:
+                if (resp.status == 429 or resp.status >= 500) and attempt < FETCH_MAX_RETRIES:
+                    delay = _retry_delay(resp.headers.get("Retry-After"), attempt)
+                else:
+                    resp.raise_for_status()
+                    return await resp.json(content_type=None)
+        logger.warning(f"{host} returned {resp.status}, retrying in {delay:.1f}s ({attempt + 1}/{FETCH_MAX_RETRIES})")
+        await asyncio.sleep(delay)
+
 # ─── DexScreener API Functions ───────────────────────────────────────────────
 
 def get_new_pairs(chain: str = "solana", limit: int = 50) -> list[dict]:
@@ -129,86 +256,114 @@ def get_new_pairs(chain: str = "solana", limit: int = 50) -> list[dict]:
         return []
 
 
+async def get_new_pairs_async(session, chain: str = "solana", limit: int = 50) -> list[dict]:
+    """Async variant of get_new_pairs() using a shared aiohttp session."""
+    pairs = await get_new_pairs_geckoterminal_async(session, chain, limit)
+
+    if pairs:
+        return pairs
+
+    try:
+        logger.info(f"GeckoTerminal returned no pairs for {chain}, trying DexScreener boosted...")
+        data = await fetch_json(session, f"{DEXSCREENER_API}/token-boosts/latest/v1")
+        chain_pairs = [p for p in data if p.get("chainId", "").lower() == chain.lower()]
+        return chain_pairs[:limit]
+    except Exception as e:
+        logger.warning(f"DexScreener boosted also failed: {e}")
+        return []
+
+
 def get_new_pairs_geckoterminal(chain: str = "solana", limit: int = 50) -> list[dict]:
     """
     Fallback: Get new pools from GeckoTerminal.
     """
     try:
-        network_map = {
-            "solana": "solana",
-            "ethereum": "eth",
-            "base": "base",
-            "bsc": "bsc",
-        }
-        network = network_map.get(chain.lower(), chain)
+        network = _GECKO_NEW_POOL_NETWORKS.get(chain.lower(), chain)
         
         url = f"{GECKOTERMINAL_API}/networks/{network}/new_pools?include=base_token,quote_token"
         resp = requests.get(url, timeout=10)
         resp.raise_for_status()
         data = resp.json()
         
-        pools = data.get("data", [])
-        included = {item["id"]: item for item in data.get("included", [])}
-        
-        # Convert to DexScreener-like format for compatibility
-        pairs = []
-        for pool in pools[:limit]:
-            attrs = pool.get("attributes", {})
-            relationships = pool.get("relationships", {})
-            
-            # Get base token info from included data
-            base_token_ref = relationships.get("base_token", {}).get("data", {})
-            base_token_id = base_token_ref.get("id", "")
-            base_token_data = included.get(base_token_id, {}).get("attributes", {})
-            
-            # Extract token details
-            token_address = base_token_data.get("address", "")
-            token_name = base_token_data.get("name", "Unknown")
-            token_symbol = base_token_data.get("symbol", "???")
-            
-            # Get pool metrics
-            liquidity = float(attrs.get("reserve_in_usd") or 0)
-            price_usd = attrs.get("base_token_price_usd")
-            
-            # Skip only if totally invalid (no address or no symbol)
-            # Allow unknown liquidity for brand new tokens
-            if not token_address or token_symbol == "???" or token_symbol == "":
-                continue
-            
-            # Parse creation time
-            created_at = attrs.get("pool_created_at")
-            pair_created_ms = None
-            if created_at:
-                try:
-                    dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    pair_created_ms = int(dt.timestamp() * 1000)
-                except:
-                    pass
-            
-            pairs.append({
-                "chainId": chain,
-                "pairAddress": pool.get("id", "").split("_")[-1] if "_" in pool.get("id", "") else pool.get("id"),
-                "baseToken": {
-                    "address": token_address,
-                    "name": token_name,
-                    "symbol": token_symbol,
-                },
-                "priceUsd": price_usd,
-                "liquidity": {"usd": liquidity},
-                "volume": {"h24": float(attrs.get("volume_usd", {}).get("h24", 0) or 0)},
-                "priceChange": {"h24": float(attrs.get("price_change_percentage", {}).get("h24", 0) or 0)},
-                "pairCreatedAt": pair_created_ms,
-                "dexId": attrs.get("dex_id", "unknown"),
-                "url": f"https://www.geckoterminal.com/{network}/pools/{pool.get('id', '').split('_')[-1] if '_' in pool.get('id', '') else pool.get('id')}",
-            })
-        
-        return pairs
+        return _parse_gecko_new_pools(data, chain, network, limit)
         
     except Exception as e:
         logger.error(f"GeckoTerminal new pools failed: {e}")
         return []
 
 
+async def get_new_pairs_geckoterminal_async(session, chain: str = "solana", limit: int = 50) -> list[dict]:
+    """Async variant of get_new_pairs_geckoterminal() using a shared aiohttp session."""
+    try:
+        network = _GECKO_NEW_POOL_NETWORKS.get(chain.lower(), chain)
+        url = f"{GECKOTERMINAL_API}/networks/{network}/new_pools?include=base_token,quote_token"
+        data = await fetch_json(session, url)
+        return _parse_gecko_new_pools(data, chain, network, limit)
+    except Exception as e:
+        logger.error(f"GeckoTerminal new pools failed: {e}")
+        return []
+
+
+def _parse_gecko_new_pools(data: dict, chain: str, network: str, limit: int) -> list[dict]:
+    """Convert a GeckoTerminal new_pools response to DexScreener-like pair dicts."""
+    pools = data.get("data", [])
+    included = {item["id"]: item for item in data.get("included", [])}
+
+    # Convert to DexScreener-like format for compatibility
+    pairs = []
+    for pool in pools[:limit]:
+        attrs = pool.get("attributes", {})
+        relationships = pool.get("relationships", {})
+
+        # Get base token info from included data
+        base_token_ref = relationships.get("base_token", {}).get("data", {})
+        base_token_id = base_token_ref.get("id", "")
+        base_token_data = included.get(base_token_id, {}).get("attributes", {})
+
+        # Extract token details
+        token_address = base_token_data.get("address", "")
+        token_name = base_token_data.get("name", "Unknown")
+        token_symbol = base_token_data.get("symbol", "???")
+
+        # Get pool metrics
+        liquidity = float(attrs.get("reserve_in_usd") or 0)
+        price_usd = attrs.get("base_token_price_usd")
+
+        # Skip only if totally invalid (no address or no symbol)
+        # Allow unknown liquidity for brand new tokens
+        if not token_address or token_symbol == "???" or token_symbol == "":
+            continue
+
+        # Parse creation time
+        created_at = attrs.get("pool_created_at")
+        pair_created_ms = None
+        if created_at:
+            try:
+                dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+                pair_created_ms = int(dt.timestamp() * 1000)
+            except:
+                pass
+
+        pairs.append({
+            "chainId": chain,
+            "pairAddress": pool.get("id", "").split("_")[-1] if "_" in pool.get("id", "") else pool.get("id"),
+            "baseToken": {
+                "address": token_address,
+                "name": token_name,
+                "symbol": token_symbol,
+            },
+            "priceUsd": price_usd,
+            "liquidity": {"usd": liquidity},
+            "volume": {"h24": float(attrs.get("volume_usd", {}).get("h24", 0) or 0)},
+            "priceChange": {"h24": float(attrs.get("price_change_percentage", {}).get("h24", 0) or 0)},
+            "pairCreatedAt": pair_created_ms,
+            "dexId": attrs.get("dex_id", "unknown"),
+            "url": f"https://www.geckoterminal.com/{network}/pools/{pool.get('id', '').split('_')[-1] if '_' in pool.get('id', '') else pool.get('id')}",
+        })
+
+    return pairs
+
+
 def get_token_pairs(token_address: str) -> list[dict]:
     """
     Get all trading pairs for a specific token.
@@ -230,6 +385,16 @@ def get_token_pairs(token_address: str) -> list[dict]:
         return []
 
 
+async def get_token_pairs_async(session, token_address: str) -> list[dict]:
+    """Async variant of get_token_pairs() using a shared aiohttp session."""
+    try:
+        data = await fetch_json(session, f"{DEXSCREENER_API}/latest/dex/tokens/{token_address}")
+        return data.get("pairs", [])
+    except Exception as e:
+        logger.error(f"Failed to fetch token pairs: {e}")
+        return []
+
+
 def get_trending_tokens(chain: str = "solana") -> list[dict]:
     """
     Get trending tokens from GeckoTerminal.
@@ -242,14 +407,7 @@ def get_trending_tokens(chain: str = "solana") -> list[dict]:
     """
     try:
         # Map chain names to GeckoTerminal network IDs
-        network_map = {
-            "solana": "solana",
-            "ethereum": "eth",
-            "base": "base",
-            "bsc": "bsc",
-            "arbitrum": "arbitrum",
-        }
-        network = network_map.get(chain.lower(), chain)
+        network = _GECKO_TRENDING_NETWORKS.get(chain.lower(), chain)
         
         url = f"{GECKOTERMINAL_API}/networks/{network}/trending_pools"
         resp = requests.get(url, timeout=10)
@@ -261,6 +419,17 @@ def get_trending_tokens(chain: str = "solana") -> list[dict]:
         return []
 
 
+async def get_trending_tokens_async(session, chain: str = "solana") -> list[dict]:
+    """Async variant of get_trending_tokens() using a shared aiohttp session."""
+    try:
+        network = _GECKO_TRENDING_NETWORKS.get(chain.lower(), chain)
+        data = await fetch_json(session, f"{GECKOTERMINAL_API}/networks/{network}/trending_pools")
+        return data.get("data", [])
+    except Exception as e:
+        logger.error(f"Failed to fetch trending tokens: {e}")
+        return []
+
+
 # ─── Token Safety Analysis ───────────────────────────────────────────────────
 
 def check_token_safety(token_address: str, chain: str = "ethereum") -> dict:
@@ -275,69 +444,139 @@ def check_token_safety(token_address: str, chain: str = "ethereum") -> dict:
         Safety analysis dict with scores and flags
     """
     try:
-        chain_id = CHAIN_IDS.get(chain.lower(), "1")
-        
-        # GoPlus requires different endpoint for Solana
-        if chain.lower() == "solana":
-            url = f"{GOPLUS_API}/solana/token_security?contract_addresses={token_address}"
-        else:
-            url = f"{GOPLUS_API}/token_security/{chain_id}?contract_addresses={token_address}"
-        
-        resp = requests.get(url, timeout=10)
+        resp = requests.get(_goplus_url(token_address, chain), timeout=10)
         resp.raise_for_status()
-        data = resp.json()
-        
-        if data.get("code") != 1:
-            return {"error": "API error", "safe": False}
-        
-        result = data.get("result", {}).get(token_address.lower(), {})
-        
-        # Parse safety flags
-        safety = {
-            "is_honeypot": result.get("is_honeypot") == "1",
-            "is_mintable": result.get("is_mintable") == "1",
-            "can_take_back_ownership": result.get("can_take_back_ownership") == "1",
-            "owner_change_balance": result.get("owner_change_balance") == "1",
-            "hidden_owner": result.get("hidden_owner") == "1",
-            "selfdestruct": result.get("selfdestruct") == "1",
-            "external_call": result.get("external_call") == "1",
-            "buy_tax": float(result.get("buy_tax", 0) or 0),
-            "sell_tax": float(result.get("sell_tax", 0) or 0),
-            "holder_count": int(result.get("holder_count", 0) or 0),
-            "lp_holder_count": int(result.get("lp_holder_count", 0) or 0),
-            "is_open_source": result.get("is_open_source") == "1",
-        }
-        
-        # Calculate safety score (0-100)
-        score = 100
-        if safety["is_honeypot"]:
-            score = 0  # Automatic fail
-        else:
-            if safety["is_mintable"]:
-                score -= 30
-            if safety["can_take_back_ownership"]:
-                score -= 20
-            if safety["owner_change_balance"]:
-                score -= 20
-            if safety["hidden_owner"]:
-                score -= 15
-            if safety["buy_tax"] > 5:
-                score -= min(20, safety["buy_tax"])
-            if safety["sell_tax"] > 5:
-                score -= min(20, safety["sell_tax"])
-            if not safety["is_open_source"]:
-                score -= 10
-        
-        safety["score"] = max(0, score)
-        safety["safe"] = score >= 50 and not safety["is_honeypot"]
-        
-        return safety
-        
+        return _parse_goplus_safety(resp.json(), token_address)
     except Exception as e:
         logger.error(f"Failed to check token safety: {e}")
         return {"error": str(e), "safe": False, "score": 0}
 
 
+async def check_token_safety_async(session, token_address: str, chain: str = "ethereum") -> dict:
+    """Async variant of check_token_safety() using a shared aiohttp session."""
+    try:
+        data = await fetch_json(session, _goplus_url(token_address, chain))
+        return _parse_goplus_safety(data, token_address)
+    except Exception as e:
+        logger.error(f"Failed to check token safety: {e}")
+        return {"error": str(e), "safe": False, "score": 0}
+
+
+async def check_token_safety_batch_async(session, addresses: list[str], chain: str) -> dict[str, dict]:
+    """
+    check_token_safety() for many tokens on one chain, with one GoPlus request
+    per GOPLUS_BATCH_SIZE addresses (the EVM endpoint takes a comma-separated
+    list; the Solana endpoint is queried one address at a time).
+
+    Returns:
+        Safety dict per token, keyed by lowercased address
+    """
+    batch_size = 1 if chain.lower() == "solana" else GOPLUS_BATCH_SIZE
+    addresses = list(dict.fromkeys(addresses))
+    batches = [addresses[i:i + batch_size] for i in range(0, len(addresses), batch_size)]
+
+    async def check_batch(batch: list[str]) -> dict[str, dict]:
+        try:
+            data = await fetch_json(session, _goplus_url(",".join(batch), chain))
+        except Exception as e:
+            logger.error(f"Failed to check token safety: {e}")
+            return {addr.lower(): {"error": str(e), "safe": False, "score": 0} for addr in batch}
+        if data.get("code") != 1:
+            return {addr.lower(): {"error": "API error", "safe": False} for addr in batch}
+        results = {key.lower(): value for key, value in (data.get("result") or {}).items()}
+        return {addr.lower(): _score_goplus_result(results.get(addr.lower(), {})) for addr in batch}
+
+    safety: dict[str, dict] = {}
+    for batch_safety in await asyncio.gather(*(check_batch(batch) for batch in batches)):
+        safety.update(batch_safety)
+    return safety
+
+
+async def check_tokens_safety_async(session, tokens: list[tuple[str, str]]) -> dict[tuple[str, str], dict]:
+    """
+    Batched safety checks for (address, chain) pairs spanning several chains:
+    one check_token_safety_batch_async() per chain, all chains concurrently.
+
+    Returns:
+        Safety dict per token, keyed by (chain, lowercased address)
+    """
+    by_chain: dict[str, list[str]] = {}
+    for address, chain in tokens:
+        by_chain.setdefault(chain, []).append(address)
+
+    chains = list(by_chain)
+    results = await asyncio.gather(
+        *(check_token_safety_batch_async(session, by_chain[chain], chain) for chain in chains)
+    )
+    return {
+        (chain, address): safety
+        for chain, chain_safety in zip(chains, results)
+        for address, safety in chain_safety.items()
+    }
+
+
+def _goplus_url(token_address: str, chain: str) -> str:
+    """GoPlus token security URL for one token (or a comma-separated batch on EVM chains)."""
+    chain_id = CHAIN_IDS.get(chain.lower(), "1")
+
+    # GoPlus requires different endpoint for Solana
+    if chain.lower() == "solana":
+        return f"{GOPLUS_API}/solana/token_security?contract_addresses={token_address}"
+    return f"{GOPLUS_API}/token_security/{chain_id}?contract_addresses={token_address}"
+
+
+def _parse_goplus_safety(data: dict, token_address: str) -> dict:
+    """Turn a GoPlus token_security response into safety flags and a 0-100 score."""
+    if data.get("code") != 1:
+        return {"error": "API error", "safe": False}
+
+    return _score_goplus_result(data.get("result", {}).get(token_address.lower(), {}))
+
+
+def _score_goplus_result(result: dict) -> dict:
+    """Safety flags and 0-100 score for one token's GoPlus result entry."""
+    # Parse safety flags
+    safety = {
+        "is_honeypot": result.get("is_honeypot") == "1",
+        "is_mintable": result.get("is_mintable") == "1",
+        "can_take_back_ownership": result.get("can_take_back_ownership") == "1",
+        "owner_change_balance": result.get("owner_change_balance") == "1",
+        "hidden_owner": result.get("hidden_owner") == "1",
+        "selfdestruct": result.get("selfdestruct") == "1",
+        "external_call": result.get("external_call") == "1",
+        "buy_tax": float(result.get("buy_tax", 0) or 0),
+        "sell_tax": float(result.get("sell_tax", 0) or 0),
+        "holder_count": int(result.get("holder_count", 0) or 0),
+        "lp_holder_count": int(result.get("lp_holder_count", 0) or 0),
+        "is_open_source": result.get("is_open_source") == "1",
+    }
+
+    # Calculate safety score (0-100)
+    score = 100
+    if safety["is_honeypot"]:
+        score = 0  # Automatic fail
+    else:
+        if safety["is_mintable"]:
+            score -= 30
+        if safety["can_take_back_ownership"]:
+            score -= 20
+        if safety["owner_change_balance"]:
+            score -= 20
+        if safety["hidden_owner"]:
+            score -= 15
+        if safety["buy_tax"] > 5:
+            score -= min(20, safety["buy_tax"])
+        if safety["sell_tax"] > 5:
+            score -= min(20, safety["sell_tax"])
+        if not safety["is_open_source"]:
+            score -= 10
+
+    safety["score"] = max(0, score)
+    safety["safe"] = score >= 50 and not safety["is_honeypot"]
+
+    return safety
+
+
 # ─── Token Info Parsing ──────────────────────────────────────────────────────
 
 def parse_pair_to_token(pair: dict) -> Optional[TokenInfo]:
@@ -378,49 +617,78 @@ def parse_pair_to_token(pair: dict) -> Optional[TokenInfo]:
 
 # ─── Main Scanner Jobs ───────────────────────────────────────────────────────
 
-def scan_new_tokens(chains: list[str] = None) -> list[MemeSignal]:
+def scan_new_tokens(
+    chains: list[str] = None,
+    pairs_by_chain: Optional[dict[str, list[dict]]] = None,
+) -> list[MemeSignal]:
     """
     Scan for newly created tokens across specified chains.
     
     Args:
         chains: List of chains to scan (default: solana, base, ethereum)
+        pairs_by_chain: Pairs already fetched for some chains; those chains
+            are scanned from these instead of being fetched again
         
     Returns:
         List of MemeSignal objects for new tokens found
     """
+    return asyncio.run(_with_session(scan_new_tokens_async, chains, pairs_by_chain))
+
+
+async def scan_new_tokens_async(
+    session,
+    chains: list[str] = None,
+    pairs_by_chain: Optional[dict[str, list[dict]]] = None,
+) -> list[MemeSignal]:
+    """
+    Async scan_new_tokens(): all chains are fetched concurrently, then the
+    safety checks for every new token in the batch run concurrently.
+    """
     if chains is None:
         chains = ["solana", "base", "ethereum"]
     
     signals = []
+    candidates: list[TokenInfo] = []
     
     for chain in chains:
         logger.info(f"Scanning {chain} for new tokens...")
-        
-        pairs = get_new_pairs(chain)
-        
-        for pair in pairs:
-            token = parse_pair_to_token(pair)
-            if not token:
-                continue
+    
+    prefetched = pairs_by_chain or {}
+    to_fetch = [chain for chain in chains if chain not in prefetched]
+    fetched = await asyncio.gather(*(get_new_pairs_async(session, chain) for chain in to_fetch))
+    pairs_by_chain = {**dict(zip(to_fetch, fetched)), **prefetched}
+    
+    # Filter sequentially so a token listed twice in the batch is only kept once.
+    # The cheap rejections run on the raw pair dict, so only survivors are
+    # parsed into a TokenInfo.
+    now_ms = time.time() * 1000
+    max_age_ms = MAX_NEW_TOKEN_AGE_MINUTES * 60_000
+    for chain in chains:
+        for pair in pairs_by_chain[chain]:
+            base_token = pair.get("baseToken") or {}
+            address = base_token.get("address", "")
             
             # Skip invalid tokens
-            if not token.address or len(token.address) < 10:
+            if not address or len(address) < 10:
                 continue
-            if token.symbol in ("???", "UNKNOWN", ""):
+            if base_token.get("symbol", "???") in _INVALID_SYMBOLS:
                 continue
-            if token.name in ("Unknown", "UNKNOWN", ""):
+            if base_token.get("name", "Unknown") in _INVALID_NAMES:
                 continue
             
             # Skip if already seen
-            token_key = f"{token.chain}:{token.address}"
+            token_key = f"{pair.get('chainId', '')}:{address}"
             if token_key in _seen_tokens:
                 continue
             
             # Check if token is new enough
-            if token.pair_created_at:
-                age_minutes = (datetime.now() - token.pair_created_at).total_seconds() / 60
-                if age_minutes > MAX_NEW_TOKEN_AGE_MINUTES:
-                    continue
+            created_ms = pair.get("pairCreatedAt")
+            if created_ms and now_ms - created_ms > max_age_ms:
+                continue
+            
+            token = parse_pair_to_token(pair)
+            if not token:
+                continue
             
             # Allow tokens with unknown liquidity (brand new) but filter out confirmed low liquidity
             # None means just created, 0 means no liquidity added yet
@@ -429,45 +697,51 @@ def scan_new_tokens(chains: list[str] = None) -> list[MemeSignal]:
             
             # Mark as seen
             _seen_tokens.add(token_key)
-            
-            # Check safety
-            safety = check_token_safety(token.address, token.chain)
-            token.safety_score = safety.get("score", 0)
-            token.is_honeypot = safety.get("is_honeypot", None)
-            token.mint_revoked = not safety.get("is_mintable", True)
-            
-            # Determine signal level based on available data
-            liquidity = token.liquidity_usd or 0
-            
-            # Default to WATCHLIST for new tokens (we want to see them!)
-            if token.safety_score < 40 or safety.get("is_honeypot"):
-                level = "WARNING"
-            elif token.safety_score >= 80 and liquidity >= 20000:
-                level = "HOT"
-            elif token.safety_score >= 60 and liquidity >= 5000:
-                level = "HOT"
-            elif liquidity >= 1000 or token.liquidity_usd is None:
-                # Has decent liquidity OR brand new (unknown liquidity)
-                level = "WATCHLIST"
-            else:
-                level = "INFO"
-            
-            # Create signal
-            age_str = ""
-            if token.pair_created_at:
-                age_min = int((datetime.now() - token.pair_created_at).total_seconds() / 60)
-                age_str = f" | Age: {age_min}min"
-            
-            # Format liquidity - handle None for brand new tokens
-            if token.liquidity_usd is not None:
-                liq_str = f"${token.liquidity_usd:,.0f}"
-            else:
-                liq_str = "⏳ Pending (brand new!)"
-            
-            price_str = f"${token.price_usd:.8f}" if token.price_usd else "⏳ Pending"
-            vol_str = f"${token.volume_24h:,.0f}" if token.volume_24h else "N/A"
-            
-            message = f"""
+            candidates.append(token)
+    
+    # Check safety: one batched GoPlus lookup per chain
+    safety_by_token = await check_tokens_safety_async(
+        session, [(token.address, token.chain) for token in candidates]
+    )
+    
+    for token in candidates:
+        safety = safety_by_token[(token.chain, token.address.lower())]
+        token.safety_score = safety.get("score", 0)
+        token.is_honeypot = safety.get("is_honeypot", None)
+        token.mint_revoked = not safety.get("is_mintable", True)
+
+        # Determine signal level based on available data
+        liquidity = token.liquidity_usd or 0
+
+        # Default to WATCHLIST for new tokens (we want to see them!)
+        if token.safety_score < 40 or safety.get("is_honeypot"):
+            level = "WARNING"
+        elif token.safety_score >= 80 and liquidity >= 20000:
+            level = "HOT"
+        elif token.safety_score >= 60 and liquidity >= 5000:
+            level = "HOT"
+        elif liquidity >= 1000 or token.liquidity_usd is None:
+            # Has decent liquidity OR brand new (unknown liquidity)
+            level = "WATCHLIST"
+        else:
+            level = "INFO"
+
+        # Create signal
+        age_str = ""
+        if token.pair_created_at:
+            age_min = int((datetime.now() - token.pair_created_at).total_seconds() / 60)
+            age_str = f" | Age: {age_min}min"
+
+        # Format liquidity - handle None for brand new tokens
+        if token.liquidity_usd is not None:
+            liq_str = f"${token.liquidity_usd:,.0f}"
+        else:
+            liq_str = "⏳ Pending (brand new!)"
+
+        price_str = f"${token.price_usd:.8f}" if token.price_usd else "⏳ Pending"
+        vol_str = f"${token.volume_24h:,.0f}" if token.volume_24h else "N/A"
+
+        message = f"""
 🆕 NEW TOKEN DETECTED
 ━━━━━━━━━━━━━━━━━━━
 Token: ${token.symbol} ({token.name})
@@ -486,17 +760,17 @@ Mintable: {'⚠️ Yes' if not token.mint_revoked else '✅ Revoked'}
 🔗 Contract: {token.address[:20]}...
 📈 {token.url}
 """
-            
-            signal = MemeSignal(
-                level=level,
-                name=f"new_token_{token.symbol}",
-                message=message.strip(),
-                token=token,
-            )
-            signals.append(signal)
-            
-            logger.info(f"[{level}] New token: ${token.symbol} on {token.chain} - Safety: {token.safety_score}")
-    
+
+        signal = MemeSignal(
+            level=level,
+            name=f"new_token_{token.symbol}",
+            message=message.strip(),
+            token=token,
+        )
+        signals.append(signal)
+
+        logger.info(f"[{level}] New token: ${token.symbol} on {token.chain} - Safety: {token.safety_score}")
+
     return signals
 
 
@@ -510,6 +784,11 @@ def scan_trending_tokens(chains: list[str] = None) -> list[MemeSignal]:
     Returns:
         List of MemeSignal objects for trending tokens
     """
+    return asyncio.run(_with_session(scan_trending_tokens_async, chains))
+
+
+async def scan_trending_tokens_async(session, chains: list[str] = None) -> list[MemeSignal]:
+    """Async scan_trending_tokens(): every chain's trending list is fetched concurrently."""
     if chains is None:
         chains = ["solana", "base"]
     
@@ -517,9 +796,10 @@ def scan_trending_tokens(chains: list[str] = None) -> list[MemeSignal]:
     
     for chain in chains:
         logger.info(f"Checking trending on {chain}...")
-        
-        trending = get_trending_tokens(chain)
-        
+    
+    trending_by_chain = await asyncio.gather(*(get_trending_tokens_async(session, chain) for chain in chains))
+    
+    for chain, trending in zip(chains, trending_by_chain):
         for item in trending[:5]:  # Top 5 trending
             try:
                 attrs = item.get("attributes", {})
@@ -626,10 +906,8 @@ def _load_portfolio_prices() -> dict:
 
 def _save_portfolio_prices(prices: dict) -> None:
     """Persist portfolio prices to state file (survives restarts)."""
-    from state_manager import load_state, save_state
-    state = load_state()
-    state["_portfolio_prices"] = prices
-    save_state(state)
+    from state_manager import commit_delta
+    commit_delta({"_portfolio_prices": prices})
 
 
 def monitor_portfolio_tokens(tokens: list[dict]) -> list[MemeSignal]:
@@ -644,90 +922,126 @@ def monitor_portfolio_tokens(tokens: list[dict]) -> list[MemeSignal]:
     Returns:
         List of MemeSignal objects for portfolio updates
     """
+    return asyncio.run(_with_session(monitor_portfolio_tokens_async, tokens))
+
+
+async def monitor_portfolio_tokens_async(session, tokens: list[dict]) -> list[MemeSignal]:
+    """Async monitor_portfolio_tokens(): all portfolio tokens are checked concurrently."""
     # Load persisted prices (survives container restarts)
     saved_prices = _load_portfolio_prices()
-    signals = []
     
-    for token_config in tokens:
-        try:
-            address = token_config["address"]
-            chain = token_config["chain"]
-            symbol = token_config["symbol"]
-            name = token_config["name"]
-            
-            logger.info(f"Checking portfolio token: ${symbol} on {chain}")
-            
-            # Get token data from DexScreener
-            pairs = get_token_pairs(address)
-            
-            if not pairs:
-                logger.warning(f"No pairs found for {symbol} ({address})")
-                continue
-            
-            # Get the primary pair (highest liquidity)
-            primary_pair = max(pairs, key=lambda p: float(p.get("liquidity", {}).get("usd", 0) or 0))
-            token = parse_pair_to_token(primary_pair)
-            
-            if not token:
-                continue
-            
-            # Get safety info (skip on every check to reduce API calls — check once per hour)
-            token_key = f"{chain}:{address}"
-            last_safety_check = saved_prices.get(f"{token_key}_safety_ts", 0)
-            now_ts = datetime.now().timestamp()
-            
-            if now_ts - last_safety_check > 3600:  # Re-check safety every hour
-                safety = check_token_safety(address, chain)
-                token.safety_score = safety.get("score", 0)
-                token.is_honeypot = safety.get("is_honeypot", None)
-                saved_prices[f"{token_key}_safety"] = token.safety_score
-                saved_prices[f"{token_key}_honeypot"] = token.is_honeypot
-                saved_prices[f"{token_key}_safety_ts"] = now_ts
-            else:
-                token.safety_score = saved_prices.get(f"{token_key}_safety", 0)
-                token.is_honeypot = saved_prices.get(f"{token_key}_honeypot", None)
-            
-            # Calculate price change since last check (persistent)
-            prev_price = saved_prices.get(token_key)
-            price_change_since_last = None
-            
-            if prev_price and token.price_usd and prev_price != token.price_usd:
-                price_change_since_last = ((token.price_usd - prev_price) / prev_price) * 100
-            
-            # Update stored price
-            if token.price_usd:
-                saved_prices[token_key] = token.price_usd
-            
-            # Determine alert level — portfolio tokens ALWAYS alert
-            change_24h = token.price_change_24h or 0
-            
-            if abs(change_24h) >= 10:
-                level = "WARNING" if change_24h < 0 else "HOT"
-            elif abs(change_24h) >= 5:
-                level = "WATCHLIST"
-            elif abs(change_24h) >= 1:
-                level = "ALERT"  # 1%+ move — always notify
-            else:
-                level = "PORTFOLIO"  # <1% change — still send for portfolio tokens
-            
-            # Format the update message
-            price_str = f"${token.price_usd:.8f}" if token.price_usd else "N/A"
-            liq_str = f"${token.liquidity_usd:,.0f}" if token.liquidity_usd else "N/A"
-            vol_str = f"${token.volume_24h:,.0f}" if token.volume_24h else "N/A"
-            
-            change_emoji = "📈" if change_24h >= 0 else "📉"
-            change_str = f"{change_24h:+.2f}%"
-            
-            since_last_str = ""
-            if price_change_since_last is not None:
-                since_emoji = "⬆️" if price_change_since_last >= 0 else "⬇️"
-                since_last_str = f"\nSince Last Check: {since_emoji} {price_change_since_last:+.4f}%"
-            elif prev_price is None:
-                since_last_str = "\nSince Last Check: 🆕 First check"
-            else:
-                since_last_str = "\nSince Last Check: ➡️ No change"
-            
-            message = f"""
+    # Re-check safety at most hourly, in one batched lookup for all stale tokens
+    now_ts = datetime.now().timestamp()
+    stale = [
+        (token_config.get("address", ""), token_config.get("chain", ""))
+        for token_config in tokens
+        if now_ts - saved_prices.get(f"{token_config.get('chain')}:{token_config.get('address')}_safety_ts", 0) > 3600
+    ]
+    safety_by_token = await check_tokens_safety_async(session, stale) if stale else {}
+    
+    # Each token reads and writes only its own keys in saved_prices
+    results = await asyncio.gather(
+        *(
+            _portfolio_token_signal(
+                session,
+                token_config,
+                saved_prices,
+                safety_by_token.get((token_config.get("chain", ""), token_config.get("address", "").lower())),
+            )
+            for token_config in tokens
+        )
+    )
+    signals = [signal for signal in results if signal is not None]
+    
+    # Persist prices to disk
+    _save_portfolio_prices(saved_prices)
+    
+    return signals
+
+
+async def _portfolio_token_signal(
+    session, token_config: dict, saved_prices: dict, safety: Optional[dict]
+) -> Optional[MemeSignal]:
+    """
+    Build the portfolio update for one token, recording its price in `saved_prices`.
+    `safety` is a fresh GoPlus result, or None to reuse the last saved one.
+    """
+    try:
+        address = token_config["address"]
+        chain = token_config["chain"]
+        symbol = token_config["symbol"]
+        name = token_config["name"]
+        
+        logger.info(f"Checking portfolio token: ${symbol} on {chain}")
+        
+        # Get token data from DexScreener
+        pairs = await get_token_pairs_async(session, address)
+        
+        if not pairs:
+            logger.warning(f"No pairs found for {symbol} ({address})")
+            return None
+        
+        # Get the primary pair (highest liquidity)
+        primary_pair = max(pairs, key=lambda p: float(p.get("liquidity", {}).get("usd", 0) or 0))
+        token = parse_pair_to_token(primary_pair)
+        
+        if not token:
+            return None
+        
+        # Get safety info (fetched by the caller at most once per hour)
+        token_key = f"{chain}:{address}"
+        
+        if safety is not None:
+            token.safety_score = safety.get("score", 0)
+            token.is_honeypot = safety.get("is_honeypot", None)
+            saved_prices[f"{token_key}_safety"] = token.safety_score
+            saved_prices[f"{token_key}_honeypot"] = token.is_honeypot
+            saved_prices[f"{token_key}_safety_ts"] = datetime.now().timestamp()
+        else:
+            token.safety_score = saved_prices.get(f"{token_key}_safety", 0)
+            token.is_honeypot = saved_prices.get(f"{token_key}_honeypot", None)
+        
+        # Calculate price change since last check (persistent)
+        prev_price = saved_prices.get(token_key)
+        price_change_since_last = None
+        
+        if prev_price and token.price_usd and prev_price != token.price_usd:
+            price_change_since_last = ((token.price_usd - prev_price) / prev_price) * 100
+        
+        # Update stored price
+        if token.price_usd:
+            saved_prices[token_key] = token.price_usd
+        
+        # Determine alert level — portfolio tokens ALWAYS alert
+        change_24h = token.price_change_24h or 0
+        
+        if abs(change_24h) >= 10:
+            level = "WARNING" if change_24h < 0 else "HOT"
+        elif abs(change_24h) >= 5:
+            level = "WATCHLIST"
+        elif abs(change_24h) >= 1:
+            level = "ALERT"  # 1%+ move — always notify
+        else:
+            level = "PORTFOLIO"  # <1% change — still send for portfolio tokens
+        
+        # Format the update message
+        price_str = f"${token.price_usd:.8f}" if token.price_usd else "N/A"
+        liq_str = f"${token.liquidity_usd:,.0f}" if token.liquidity_usd else "N/A"
+        vol_str = f"${token.volume_24h:,.0f}" if token.volume_24h else "N/A"
+        
+        change_emoji = "📈" if change_24h >= 0 else "📉"
+        change_str = f"{change_24h:+.2f}%"
+        
+        since_last_str = ""
+        if price_change_since_last is not None:
+            since_emoji = "⬆️" if price_change_since_last >= 0 else "⬇️"
+            since_last_str = f"\nSince Last Check: {since_emoji} {price_change_since_last:+.4f}%"
+        elif prev_price is None:
+            since_last_str = "\nSince Last Check: 🆕 First check"
+        else:
+            since_last_str = "\nSince Last Check: ➡️ No change"
+        
+        message = f"""
 💼 PORTFOLIO UPDATE: ${symbol}
 ━━━━━━━━━━━━━━━━━━━
 Token: {name}
@@ -743,24 +1057,20 @@ Safety Score: {token.safety_score}/100
 
 🔗 {token.url}
 """
-            
-            signal = MemeSignal(
-                level=level,
-                name=f"portfolio_{symbol}",
-                message=message.strip(),
-                token=token,
-            )
-            signals.append(signal)
-            
-            logger.info(f"Portfolio {symbol}: ${token.price_usd:.8f} ({change_24h:+.2f}% 24h)")
-            
-        except Exception as e:
-            logger.error(f"Error monitoring {token_config.get('symbol', 'unknown')}: {e}")
-    
-    # Persist prices to disk
-    _save_portfolio_prices(saved_prices)
-    
-    return signals
+        
+        signal = MemeSignal(
+            level=level,
+            name=f"portfolio_{symbol}",
+            message=message.strip(),
+            token=token,
+        )
+        
+        logger.info(f"Portfolio {symbol}: ${token.price_usd:.8f} ({change_24h:+.2f}% 24h)")
+        return signal
+
+    except Exception as e:
+        logger.error(f"Error monitoring {token_config.get('symbol', 'unknown')}: {e}")
+        return None
 
 
 def job_portfolio_tokens() -> None:
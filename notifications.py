@@ -213,8 +213,9 @@ def send_daily_summary(state: dict, info_signals: list) -> dict[str, bool]:
 
     # News
     if state.get("news_negative_hits") is not None:
+        at_least = "at least " if state.get("news_scan_complete") is False else ""
         lines.append(
-            f"News:    {state['news_negative_hits']} negative hits / "
+            f"News:    {at_least}{state['news_negative_hits']} negative hits / "
             f"{state.get('news_articles_scanned', 0)} articles"
         )
 
@@ -71,6 +71,33 @@ def _get(endpoint: str, params: Optional[dict] = None) -> Optional[dict]:
         return None
 
 
+async def _get_async(session, endpoint: str, params: Optional[dict] = None) -> Optional[dict]:
+    """
+    Async counterpart of _get() over a shared aiohttp.ClientSession.
+    Returns parsed JSON or None on failure.
+    """
+    import aiohttp
+
+    if not _polygon_available():
+        return None
+
+    url = f"{BASE_URL}{endpoint}"
+    params = {**(params or {}), "apiKey": POLYGON_API_KEY}
+
+    try:
+        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status == 429:
+                logger.warning("Polygon rate limit hit")
+                return None
+
+            response.raise_for_status()
+            return await response.json()
+
+    except (aiohttp.ClientError, TimeoutError) as e:
+        logger.error(f"Polygon API request failed: {endpoint} — {e}")
+        return None
+
+
 # ─── Market Status ───────────────────────────────────────────────────────────
 
 def get_market_status() -> Optional[dict]:
@@ -115,7 +142,18 @@ def get_previous_close(ticker: str) -> Optional[dict]:
     # Polygon uses "X:" prefix for crypto (e.g., "X:BTCUSD")
     poly_ticker = _convert_ticker(ticker)
     data = _get(f"/v2/aggs/ticker/{poly_ticker}/prev")
+    return _parse_previous_close(ticker, data)
 
+
+async def get_previous_close_async(session, ticker: str) -> Optional[dict]:
+    """Async variant of get_previous_close() using a shared aiohttp session."""
+    poly_ticker = _convert_ticker(ticker)
+    data = await _get_async(session, f"/v2/aggs/ticker/{poly_ticker}/prev")
+    return _parse_previous_close(ticker, data)
+
+
+def _parse_previous_close(ticker: str, data: Optional[dict]) -> Optional[dict]:
+    """Extract OHLCV fields from a /prev aggregates response."""
     if data is None or data.get("resultsCount", 0) == 0:
         return None
 
@@ -322,7 +360,26 @@ def get_all_stock_snapshots(tickers: list[str]) -> dict[str, dict]:
         "/v2/snapshot/locale/us/markets/stocks/tickers",
         params={"tickers": poly_tickers},
     )
+    return _parse_snapshots(data)
+
+
+async def get_all_stock_snapshots_async(session, tickers: list[str]) -> dict[str, dict]:
+    """Async variant of get_all_stock_snapshots() using a shared aiohttp session."""
+    stock_tickers = [t for t in tickers if not t.endswith("-USD")]
+    if not stock_tickers:
+        return {}
+
+    poly_tickers = ",".join(_convert_ticker(t) for t in stock_tickers)
+    data = await _get_async(
+        session,
+        "/v2/snapshot/locale/us/markets/stocks/tickers",
+        params={"tickers": poly_tickers},
+    )
+    return _parse_snapshots(data)
+
 
+def _parse_snapshots(data: Optional[dict]) -> dict[str, dict]:
+    """Convert a multi-ticker snapshot response into ticker -> fields."""
     if data is None or not data.get("tickers"):
         return {}
 
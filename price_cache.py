@@ -0,0 +1,289 @@
+"""
+price_cache.py — Shared daily close-price cache for the agent tools
+
+Every CustomTools analysis needs daily closes for a handful of tickers over
+overlapping windows. This module keeps one copy of each (ticker, start, end)
+close series in memory and on disk under .cache/prices/, and fetches only the
+tickers that are missing — concurrently, over an aiohttp session it owns.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+import weakref
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable, Hashable, Optional, TypeVar, Union
+
+import pandas as pd
+
+from yahoo_async import fetch_chart
+
+logger = logging.getLogger(__name__)
+
+PRICE_CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "prices"
+INTRADAY_TTL_S = 3600       # window ends today: the last bar is still moving
+DAILY_TTL_S = 86400         # window ended before today: history is settled
+MEMORY_CACHE_SIZE = 512     # (ticker, window) series kept in memory, LRU beyond this
+PRUNE_INTERVAL_S = 3600     # how often a writer sweeps expired files off disk
+
+_PERIOD_RE = re.compile(r"^(\d+)(d|wk|mo|y)$")
+_PERIOD_UNIT_DAYS = {"d": 1, "wk": 7, "mo": 30, "y": 365}
+
+DateLike = Union[date, datetime, str]
+T = TypeVar("T")
+
+
+class FileCache:
+    """
+    Pickled pandas objects on disk, expired by file modification time.
+
+    Pickle rather than parquet so the cache needs nothing beyond pandas.
+    Writes go through a temp file + os.replace so concurrent readers never
+    see a half-written blob. Keys include a rolling date window, so writes
+    also periodically delete files older than `max_age_s` (the longest TTL
+    any reader uses) to keep the directory from growing without bound.
+    """
+
+    def __init__(self, root: Path = PRICE_CACHE_DIR, max_age_s: float = DAILY_TTL_S):
+        self.root = Path(root)
+        self.max_age_s = max_age_s
+        self._next_prune = 0.0  # time.monotonic() after which put() sweeps again
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.pkl"
+
+    def get(self, key: str, ttl_s: float) -> Optional[pd.Series]:
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > ttl_s:
+                return None
+            return pd.read_pickle(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable price cache entry {path.name}: {e}")
+            return None
+
+    def put(self, key: str, value: pd.Series) -> None:
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            value.to_pickle(tmp)
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.warning(f"Could not write price cache entry {path.name}: {e}")
+        if time.monotonic() >= self._next_prune:
+            self._next_prune = time.monotonic() + PRUNE_INTERVAL_S
+            self.prune()
+
+    def prune(self) -> int:
+        """Delete entries (and stray temp files) older than max_age_s. Returns the count."""
+        cutoff = time.time() - self.max_age_s
+        removed = 0
+        try:
+            for path in self.root.iterdir():
+                if path.suffix not in (".pkl", ".tmp"):
+                    continue
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                        removed += 1
+                except FileNotFoundError:
+                    pass  # removed by a concurrent sweep
+        except OSError as e:
+            logger.warning(f"Could not prune price cache: {e}")
+        if removed:
+            logger.debug(f"Pruned {removed} expired price cache entries")
+        return removed
+
+
+class InflightCache:
+    """
+    Coalesces concurrent requests for the same key onto one task.
+
+    While a fetch for a key is running, further callers await the same task
+    instead of issuing their own request. The task is shielded, so one caller
+    being cancelled does not abort the fetch for the others.
+    """
+
+    def __init__(self):
+        self._pending: dict[Hashable, asyncio.Task] = {}
+
+    async def get(self, key: Hashable, fetcher: Callable[[], Awaitable[T]]) -> T:
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetcher())
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(task)
+
+
+class SessionLease:
+    """
+    aiohttp session owned by the cache and shared by the fetches in flight on
+    one event loop. The first fetch opens it and the last one to finish closes
+    it, so a coalesced fetch never depends on the lifetime of the caller that
+    happened to start it.
+    """
+
+    def __init__(self):
+        self._session = None
+        self._users = 0
+
+    async def __aenter__(self):
+        if self._users == 0:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession()
+        self._users += 1
+        return self._session
+
+    async def __aexit__(self, *exc) -> None:
+        self._users -= 1
+        if self._users == 0:
+            session, self._session = self._session, None
+            await session.close()
+
+
+_file_cache = FileCache()
+# key -> (expires_at_monotonic, close series); fronts the disk cache
+_memory_cache: OrderedDict[str, tuple[float, pd.Series]] = OrderedDict()
+_inflight = InflightCache()
+_session_leases: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()  # loop -> SessionLease
+
+
+def _session_lease() -> SessionLease:
+    """The cache's session lease for the running event loop."""
+    loop = asyncio.get_running_loop()
+    lease = _session_leases.get(loop)
+    if lease is None:
+        lease = _session_leases[loop] = SessionLease()
+    return lease
+
+
+def _memory_get(key: str, now: float) -> Optional[pd.Series]:
+    """Series cached in memory for `key`, dropping the entry if it has expired."""
+    entry = _memory_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= now:
+        del _memory_cache[key]
+        return None
+    _memory_cache.move_to_end(key)
+    return entry[1]
+
+
+def _memory_put(key: str, expires_at: float, series: pd.Series) -> None:
+    _memory_cache[key] = (expires_at, series)
+    _memory_cache.move_to_end(key)
+    if len(_memory_cache) > MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _as_day(value: DateLike) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def period_start(period: str, today: Optional[date] = None) -> date:
+    """Translate a yfinance period string (5d, 1mo, 1y, ytd...) into a start date."""
+    today = today or date.today()
+    if period == "ytd":
+        return date(today.year, 1, 1)
+    match = _PERIOD_RE.match(period)
+    if not match:
+        raise ValueError(f"Unsupported period: {period}")
+    count, unit = match.groups()
+    return today - timedelta(days=int(count) * _PERIOD_UNIT_DAYS[unit])
+
+
+async def _fetch_and_store(ticker: str, start_day: date, end_day: date, ttl_s: float) -> pd.Series:
+    """Fetch one ticker's closes on the cache's session and write them to both cache layers."""
+    async with _session_lease() as session:
+        series = await fetch_chart(session, ticker, start_day, end_day)
+    if not series.empty:
+        key = f"{ticker}_{start_day.isoformat()}_{end_day.isoformat()}"
+        _memory_put(key, time.monotonic() + ttl_s, series)
+        _file_cache.put(key, series)
+    return series
+
+
+async def _fetch_all(tickers: list[str], start_day: date, end_day: date, ttl_s: float) -> list:
+    """
+    Fetch every ticker concurrently, joining any fetch of the same
+    (ticker, window) already in flight. Failures come back as exception objects.
+    """
+    return await asyncio.gather(
+        *(
+            _inflight.get(
+                (t, start_day, end_day),
+                lambda t=t: _fetch_and_store(t, start_day, end_day, ttl_s),
+            )
+            for t in tickers
+        ),
+        return_exceptions=True,
+    )
+
+
+async def cached_download(
+    tickers: Union[str, list[str]],
+    start: DateLike,
+    end: Optional[DateLike] = None,
+) -> pd.DataFrame:
+    """
+    Daily closes for `tickers` between `start` and `end` (exclusive, as in
+    yfinance; defaults to tomorrow so today's bar is included).
+
+    Cached tickers are served from memory/disk; the rest are fetched
+    concurrently from the Yahoo chart API and written back per ticker.
+    Concurrent calls needing the same ticker and window share one fetch.
+
+    Returns:
+        DataFrame indexed by date with one column per ticker that had data
+        (the same shape as yf.download(...)["Close"]).
+    """
+    if isinstance(tickers, str):
+        tickers = [tickers]
+    tickers = list(dict.fromkeys(tickers))
+
+    today = date.today()
+    start_day = _as_day(start)
+    end_day = _as_day(end) if end is not None else today + timedelta(days=1)
+    ttl_s = INTRADAY_TTL_S if end_day > today else DAILY_TTL_S
+    now = time.monotonic()
+
+    columns: dict[str, pd.Series] = {}
+    missing: list[str] = []
+    for ticker in tickers:
+        key = f"{ticker}_{start_day.isoformat()}_{end_day.isoformat()}"
+        series = _memory_get(key, now)
+        if series is not None:
+            columns[ticker] = series
+            continue
+        series = _file_cache.get(key, ttl_s)
+        if series is not None:
+            _memory_put(key, now + ttl_s, series)
+            columns[ticker] = series
+        else:
+            missing.append(ticker)
+
+    if missing:
+        results = await _fetch_all(missing, start_day, end_day, ttl_s)
+        for ticker, series in zip(missing, results):
+            if isinstance(series, BaseException):
+                logger.warning(f"Price history fetch failed for {ticker}: {series}")
+            elif not series.empty:
+                columns[ticker] = series
+
+    present = [t for t in tickers if t in columns]
+    if not present:
+        return pd.DataFrame()
+    return pd.concat([columns[t] for t in present], axis=1, keys=present)
@@ -11,17 +11,40 @@ On DigitalOcean App Platform, this file is ephemeral (resets on redeploy),
 which is acceptable since alerts are triggered by state changes.
 """
 
+import functools
 import json
 import logging
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Any
 from zoneinfo import ZoneInfo
 
 from config import STATE_FILE_PATH
 
+try:
+    import orjson  # Optional: 3-10x faster state (de)serialization
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl  # POSIX only: serializes commits across processes
+except ImportError:
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+# Same on-disk format as json.dump(indent=2, default=str): datetimes go through str()
+_ORJSON_OPTIONS = (
+    (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+    if orjson is not None else 0
+)
+
+# Serializes read-merge-write commits between scheduler threads; the flock on
+# a sidecar file extends that to other processes sharing the state file.
+_STATE_LOCK = threading.Lock()
+
 
 def load_state() -> dict[str, Any]:
     """
@@ -33,8 +56,8 @@ def load_state() -> dict[str, Any]:
         return {}
 
     try:
-        with open(STATE_FILE_PATH, "r") as f:
-            state = json.load(f)
+        with open(STATE_FILE_PATH, "rb") as f:
+            state = orjson.loads(f.read()) if orjson is not None else json.load(f)
             logger.info(f"Loaded state from {STATE_FILE_PATH} ({len(state)} keys)")
             return state
     except (json.JSONDecodeError, IOError) as e:
@@ -52,8 +75,16 @@ def save_state(state: dict[str, Any]) -> bool:
         state["_last_updated"] = datetime.now(ZoneInfo("US/Eastern")).isoformat()
         state["_version"] = "1.0"
 
-        with open(STATE_FILE_PATH, "w") as f:
-            json.dump(state, f, indent=2, default=str)
+        if orjson is not None:
+            payload = orjson.dumps(state, default=str, option=_ORJSON_OPTIONS)
+        else:
+            payload = json.dumps(state, indent=2, default=str).encode()
+
+        # Write-then-rename so a concurrent load_state() never sees a partial file
+        tmp_path = f"{STATE_FILE_PATH}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, STATE_FILE_PATH)
 
         logger.info(f"State saved to {STATE_FILE_PATH}")
         return True
@@ -71,6 +102,36 @@ def update_state(current_state: dict[str, Any], updates: dict[str, Any]) -> dict
     return merged
 
 
+@contextmanager
+def _state_file_lock():
+    """Hold the in-process lock and, where available, an exclusive flock."""
+    with _STATE_LOCK:
+        if fcntl is None:
+            yield
+            return
+        with open(f"{STATE_FILE_PATH}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def commit_delta(delta: dict[str, Any]) -> dict[str, Any]:
+    """
+    Merge `delta` into the on-disk state and save it, atomically with respect
+    to other commits. Jobs running concurrently each commit only the keys they
+    own, so one job's save can no longer overwrite another's fresh values
+    with a stale snapshot.
+    Returns the merged state.
+    """
+    with _state_file_lock():
+        state = load_state()
+        state.update(delta)
+        save_state(state)
+    return state
+
+
 def get_state_value(state: dict, key: str, default: Any = None) -> Any:
     """Safely get a value from state with a default."""
     return state.get(key, default)
@@ -88,8 +149,30 @@ def clear_state() -> bool:
         return False
 
 
+# State keys read by get_state_summary(); their values form the memo key
+_SUMMARY_KEYS = (
+    "spy_price", "spy_above_sma", "spy_sma_200",
+    "ivv_price", "ivv_high_water_mark", "ivv_drop_pct",
+    "btc_price", "btc_change_24h_pct", "btc_change_7d_pct",
+    "fed_rate_current", "news_negative_hits", "news_scan_complete", "_last_updated",
+)
+
+
 def get_state_summary(state: dict) -> str:
     """Generate a human-readable summary of the current state."""
+    values = tuple(state.get(k) for k in _SUMMARY_KEYS)
+    try:
+        return _cached_state_summary(values)
+    except TypeError:  # unhashable value — skip the memo
+        return _format_state_summary(state)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_state_summary(values: tuple) -> str:
+    return _format_state_summary({k: v for k, v in zip(_SUMMARY_KEYS, values) if v is not None})
+
+
+def _format_state_summary(state: dict) -> str:
     lines = ["Current Monitor State:"]
 
     if state.get("spy_price"):
@@ -114,7 +197,8 @@ def get_state_summary(state: dict) -> str:
         lines.append(f"  Fed Rate: {state['fed_rate_current']}%")
 
     if state.get("news_negative_hits") is not None:
-        lines.append(f"  News: {state['news_negative_hits']} negative hits")
+        at_least = "at least " if state.get("news_scan_complete") is False else ""
+        lines.append(f"  News: {at_least}{state['news_negative_hits']} negative hits")
 
     lines.append(f"  Last Updated: {state.get('_last_updated', 'N/A')}")
 
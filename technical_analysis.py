@@ -12,6 +12,7 @@ Data Source Priority:
   2. yfinance (local SMA calculation, individual price fetches) — FALLBACK
 """
 
+import asyncio
 import logging
 from typing import Optional
 
@@ -35,7 +36,9 @@ from polygon_provider import (
     get_rsi as polygon_get_rsi,
     get_current_price as polygon_get_price,
     get_all_stock_snapshots,
+    get_all_stock_snapshots_async,
     get_crypto_price as polygon_get_crypto_price,
+    get_previous_close_async,
     get_aggregates,
 )
 
@@ -47,11 +50,26 @@ logger = logging.getLogger(__name__)
 class MarketSignal:
     """Represents a single analysis signal."""
 
+    __slots__ = ("name", "level", "message", "value", "_as_dict")
+
     def __init__(self, name: str, level: str, message: str, value: Optional[float] = None):
         self.name = name        # e.g., "SMA_CROSS", "TRAILING_STOP", "CRYPTO_CANARY"
         self.level = level      # "CRITICAL", "WARNING", "INFO", "GREEN"
         self.message = message
         self.value = value      # optional numeric value for context
+        self._as_dict: Optional[dict] = None
+
+    @property
+    def as_dict(self) -> dict:
+        """Serializable form of the signal, built once on first access."""
+        if self._as_dict is None:
+            self._as_dict = {
+                "name": self.name,
+                "level": self.level,
+                "message": self.message,
+                "value": self.value,
+            }
+        return self._as_dict
 
     def __repr__(self) -> str:
         return f"Signal({self.level}: {self.name} — {self.message})"
@@ -430,31 +448,102 @@ def fetch_all_prices(tickers: list[str]) -> dict[str, Optional[float]]:
         # Try Polygon snapshot for all stocks in one call
         stock_tickers = [t for t in tickers if not t.endswith("-USD")]
         crypto_tickers = [t for t in tickers if t.endswith("-USD")]
+        fallback: list[str] = []
 
         snapshots = get_all_stock_snapshots(stock_tickers)
         for ticker in stock_tickers:
             snap = snapshots.get(ticker)
             if snap and snap.get("price"):
                 prices[ticker] = float(snap["price"])
-                continue
-            # Fallback to yfinance for this ticker
-            prices[ticker] = _yfinance_price(ticker)
+            else:
+                fallback.append(ticker)
 
-        # Crypto via Polygon individual calls or yfinance
+        # Crypto via Polygon individual calls
         for ticker in crypto_tickers:
             price = polygon_get_crypto_price(ticker)
             if price is not None:
                 prices[ticker] = price
             else:
-                prices[ticker] = _yfinance_price(ticker)
+                fallback.append(ticker)
+
+        # Whatever Polygon missed comes from one batched yfinance download
+        if fallback:
+            prices.update(_yfinance_prices(fallback))
+            prices = {t: prices[t] for t in stock_tickers + crypto_tickers}
 
         logger.info(f"Fetched {len(prices)} prices (Polygon primary)")
     else:
         # Pure yfinance path
-        for ticker in tickers:
-            prices[ticker] = _yfinance_price(ticker)
+        prices = _yfinance_prices(tickers)
+        logger.info(f"Fetched {len(prices)} prices (yfinance only)")
+
+    return prices
+
+
+# Max in-flight price requests for fetch_all_prices_async()
+PRICE_FETCH_CONCURRENCY = 64
+
+
+async def fetch_all_prices_async(session, tickers: list[str]) -> dict[str, Optional[float]]:
+    """
+    Async fetch_all_prices(): fans out per-ticker requests concurrently.
+
+    Args:
+        session: Shared aiohttp.ClientSession used for Polygon calls.
+        tickers: Tickers to price.
+
+    Returns:
+        Dict of ticker -> price (None if every source failed).
+    """
+    sem = asyncio.Semaphore(PRICE_FETCH_CONCURRENCY)
+
+    async def yfinance_price(ticker: str) -> Optional[float]:
+        async with sem:
+            return await asyncio.to_thread(_yfinance_price, ticker)
+
+    async def crypto_price(ticker: str) -> Optional[float]:
+        async with sem:
+            prev = await get_previous_close_async(session, ticker)
+        if prev and prev.get("close"):
+            return float(prev["close"])
+        return await yfinance_price(ticker)
+
+    if not USE_POLYGON_PRIMARY:
+        results = await asyncio.gather(*(yfinance_price(t) for t in tickers), return_exceptions=True)
+        prices = {t: (None if isinstance(p, BaseException) else p) for t, p in zip(tickers, results)}
         logger.info(f"Fetched {len(prices)} prices (yfinance only)")
+        return prices
+
+    stock_tickers = [t for t in tickers if not t.endswith("-USD")]
+    crypto_tickers = [t for t in tickers if t.endswith("-USD")]
 
+    # One snapshot call for all stocks, crypto prev-closes in parallel with it
+    snapshots, *crypto_results = await asyncio.gather(
+        get_all_stock_snapshots_async(session, stock_tickers),
+        *(crypto_price(t) for t in crypto_tickers),
+        return_exceptions=True,
+    )
+    if isinstance(snapshots, BaseException):
+        logger.error(f"Polygon snapshot failed: {snapshots}")
+        snapshots = {}
+
+    prices: dict[str, Optional[float]] = {}
+    missing = []
+    for ticker in stock_tickers:
+        snap = snapshots.get(ticker)
+        if snap and snap.get("price"):
+            prices[ticker] = float(snap["price"])
+        else:
+            missing.append(ticker)
+
+    # Fallback to yfinance for stocks the snapshot didn't cover
+    fallback = await asyncio.gather(*(yfinance_price(t) for t in missing), return_exceptions=True)
+    for ticker, price in zip(missing, fallback):
+        prices[ticker] = None if isinstance(price, BaseException) else price
+    for ticker, price in zip(crypto_tickers, crypto_results):
+        prices[ticker] = None if isinstance(price, BaseException) else price
+
+    logger.info(f"Fetched {len(prices)} prices (Polygon primary, async)")
     return prices
 
 
@@ -471,6 +560,28 @@ def _yfinance_price(ticker: str) -> Optional[float]:
         return None
 
 
+def _yfinance_prices(tickers: list[str]) -> dict[str, Optional[float]]:
+    """
+    Latest close for several tickers from a single yfinance download.
+    Falls back to per-ticker _yfinance_price() if the batch request fails.
+    """
+    try:
+        closes = yf.download(tickers, period="2d", progress=False)["Close"]
+        if isinstance(closes, pd.Series):
+            closes = closes.to_frame(tickers[0])
+        # Crypto trades on days equities don't; carry each column's last close forward
+        last = closes.ffill().iloc[-1] if not closes.empty else pd.Series(dtype=float)
+    except Exception as e:
+        logger.error(f"Batched yfinance download failed for {tickers}: {e}")
+        return {ticker: _yfinance_price(ticker) for ticker in tickers}
+
+    prices: dict[str, Optional[float]] = {}
+    for ticker in tickers:
+        price = last.get(ticker)
+        prices[ticker] = float(price) if price is not None and pd.notna(price) else None
+    return prices
+
+
 # ─── Full Analysis Run ──────────────────────────────────────────────────────
 
 def analyze_market_health(previous_state: dict) -> tuple[list[MarketSignal], dict]:
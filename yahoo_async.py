@@ -0,0 +1,66 @@
+"""
+yahoo_async.py — Non-blocking daily history from Yahoo Finance's chart API
+
+A thin aiohttp client for the same v8 chart endpoint yfinance uses
+internally, so async callers can fetch daily closes without blocking the
+event loop.
+
+API Endpoint Used:
+  - GET /v8/finance/chart/{ticker}?period1=..&period2=..&interval=1d
+"""
+
+import logging
+from datetime import date, datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+# Yahoo rejects requests without a browser-like User-Agent
+REQUEST_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; market-monitor)"}
+
+
+def _epoch(day: date) -> int:
+    return int(datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp())
+
+
+async def fetch_chart(session, ticker: str, period1: date, period2: date) -> pd.Series:
+    """
+    Daily closes for `ticker` in [period1, period2).
+
+    Uses the split/dividend-adjusted close when Yahoo provides it (matching
+    yfinance's default), otherwise the raw close. Bars without a close are
+    dropped.
+
+    Returns:
+        Float64 Series indexed by (naive) bar date, named after the ticker.
+        Raises aiohttp.ClientError / ValueError on transport or API errors.
+    """
+    import aiohttp
+
+    async with session.get(
+        CHART_URL.format(ticker=ticker),
+        params={"period1": _epoch(period1), "period2": _epoch(period2), "interval": "1d"},
+        headers=REQUEST_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=15),
+    ) as response:
+        response.raise_for_status()
+        payload = await response.json()
+
+    chart = payload.get("chart") or {}
+    if chart.get("error"):
+        raise ValueError(f"Yahoo chart error for {ticker}: {chart['error']}")
+    result = (chart.get("result") or [None])[0]
+    if not result or not result.get("timestamp"):
+        return pd.Series(dtype=np.float64, name=ticker)
+
+    indicators = result["indicators"]
+    adjclose = indicators.get("adjclose") or [{}]
+    closes = adjclose[0].get("adjclose") or indicators["quote"][0]["close"]
+
+    values = np.array(closes, dtype=np.float64)  # None -> NaN
+    index = pd.to_datetime(np.asarray(result["timestamp"], dtype=np.int64), unit="s").normalize()
+    series = pd.Series(values, index=index, name=ticker)
+    return series[~np.isnan(values)]